@@ -1,22 +1,31 @@
 import os
+import atexit
 import sys
 import time
 import threading
 import logging
+import logging.handlers
+import bisect
 import random
 import json
+import mmap
 import queue
+import re
 import traceback
-from datetime import datetime, timedelta
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import date, datetime, timedelta
+from io import BytesIO
 from xml.etree import ElementTree as ET
 
 import tkinter as tk
 from tkinter import ttk, messagebox
 from tkinter import font as tkfont
 
-from ttkbootstrap import Style
-from plexapi.server import PlexServer
-import requests
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
 
 # ------------------------------ Constants and Configuration ------------------------------
 
@@ -26,26 +35,161 @@ LOG_FILE = os.path.join(LOG_DIR, 'DynamiX.log')
 CONFIG_FILE = 'config.json'
 USED_COLLECTIONS_FILE = 'used_collections.json'
 USER_EXEMPTIONS_FILE = 'user_exemptions.json'
+COLLECTION_CACHE_FILE = 'collection_cache.json'
+
+# Attempts and delay between them when replacing a data file that is briefly held open
+# (Windows refuses to replace a file another thread has open or mapped)
+REPLACE_RETRIES = 10
+REPLACE_RETRY_DELAY = 0.05  # seconds
+
+# Maximum number of rows passed to a single Listbox.insert call
+LISTBOX_INSERT_CHUNK = 5000
+# Maximum number of log messages written to the Logs tab per Tk event-loop turn
+LOG_DRAIN_BATCH = 200
+# Tcl procedure used by VirtualCheckList to rebind all of its pooled rows in one call
+VIRTUAL_LIST_REBIND_PROC = "dynamix_rebind_rows"
+# Wheel events arriving within this many milliseconds are applied as one scroll (about one frame)
+WHEEL_COALESCE_MS = 16
+# Lines kept in the Logs tab; the oldest LOG_VIEW_TRIM_LINES are dropped once exceeded
+LOG_VIEW_MAX_LINES = 5000
+LOG_VIEW_TRIM_LINES = 1000
+
+# How long a fetched Plex server name is reused before asking the server again
+SERVER_NAME_CACHE_TTL = 600  # seconds
+# Per-request timeout and connection retries for the GUI's Plex requests; closing the window
+# waits for requests already in flight, so these keep an unreachable server from holding it open
+GUI_PLEX_TIMEOUT = 10  # seconds
+GUI_PLEX_CONNECT_RETRIES = 1
+
+# Lowercased title of the collection that can be kept pinned permanently
+NEW_EPISODES_TITLE = "new episodes"
+
+# HH:MM time of day; like strptime's %H:%M it also accepts single-digit hours and minutes
+_HHMM_RE = re.compile(r"(?:[01]?\d|2[0-3]):[0-5]?\d")
+
+# Day names indexed by datetime.weekday()
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
 # Ensure the logs directory exists
 os.makedirs(LOG_DIR, exist_ok=True)
 
-# Configure logging to file and stdout
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE, mode='w', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
+# Configure logging to file and stdout. Records are handed to a background listener thread
+# through a queue so formatting and file I/O never block the calling thread.
+_log_formatter = logging.Formatter('%(asctime)s - %(message)s')
+_file_handler = logging.FileHandler(LOG_FILE, mode='w', encoding='utf-8')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _file_handler, _stream_handler, respect_handler_level=True
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
 
 # ------------------------------ Helper Functions ------------------------------
 
+def _loads_json(data):
+    """
+    Parse JSON text using orjson when available, falling back to the stdlib json module.
+
+    Args:
+        data (bytes | str): JSON document to parse.
+
+    Returns:
+        Any: Parsed JSON object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _read_json(path):
+    """
+    Read and parse a JSON file through a read-only memory map.
+
+    Args:
+        path (str): Path of the JSON file.
+
+    Returns:
+        Any: Parsed JSON object.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _loads_json(b"")  # mmap refuses empty files; let the parser raise
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+                if hasattr(mmap, 'MADV_WILLNEED'):
+                    mm.madvise(mmap.MADV_WILLNEED)
+            if orjson is not None:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return json.loads(mm[:])
+        finally:
+            mm.close()
+
+def _dumps_json(obj):
+    """
+    Serialize an object to indented UTF-8 JSON bytes.
+
+    Args:
+        obj (Any): Object to serialize.
+
+    Returns:
+        bytes: Encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=4, ensure_ascii=False).encode('utf-8')
+
+def _atomic_write_json(path, obj):
+    """
+    Write an object as JSON via a temporary file and an atomic rename.
+
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+
+    Args:
+        path (str): Destination file path.
+        obj (Any): Object to serialize.
+
+    Raises:
+        OSError: If the file could not be written or replaced; the temporary file is removed.
+    """
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps_json(obj))
+            f.flush()
+            os.fsync(f.fileno())
+
+        # A concurrent reader (see _read_json) keeps the target open for a moment on Windows
+        for attempt in range(REPLACE_RETRIES):
+            try:
+                os.replace(tmp_path, path)
+                return
+            except PermissionError:
+                if attempt == REPLACE_RETRIES - 1:
+                    raise
+                time.sleep(REPLACE_RETRY_DELAY)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def sanitize_time_blocks(time_blocks):
     """
     Ensure time_blocks is properly formatted as a dictionary.
 
+    Valid input is returned as-is; only malformed day entries are replaced, in place.
+    Individual blocks are validated when the schedule is compiled (see _compile_schedule).
+
     Args:
         time_blocks (Any): The time_blocks data to sanitize.
 
@@ -55,14 +199,11 @@ def sanitize_time_blocks(time_blocks):
     if not isinstance(time_blocks, dict):
         logging.warning(f"Sanitizing time_blocks: expected dict but got {type(time_blocks)}. Resetting to empty.")
         return {}
-    sanitized = {}
     for day, blocks in time_blocks.items():
         if not isinstance(blocks, dict):
             logging.warning(f"Invalid blocks for day '{day}': resetting to empty dictionary.")
-            sanitized[day] = {}
-        else:
-            sanitized[day] = blocks
-    return sanitized
+            time_blocks[day] = {}  # Replacing a value does not resize the dict, so iteration stays valid
+    return time_blocks
 
 def load_config():
     """
@@ -76,9 +217,8 @@ def load_config():
         return {}
 
     try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-    except json.JSONDecodeError:
+        config = _read_json(CONFIG_FILE)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
         logging.error(f"Configuration file '{CONFIG_FILE}' is empty or invalid. Resetting to default.")
         return {}
 
@@ -102,9 +242,10 @@ def save_config(config):
         config (dict): Configuration dictionary to save.
     """
     try:
-        logging.info(f"Final configuration to save: {json.dumps(config, indent=4)}")
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4, ensure_ascii=False)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Final configuration to save: %s", json.dumps(config, indent=4))
+        logging.info("Saving configuration (%d top-level keys)", len(config))
+        _atomic_write_json(CONFIG_FILE, config)
         logging.info("Configuration file saved successfully.")
     except Exception as e:
         logging.error(f"Error saving configuration file: {e}")
@@ -114,13 +255,23 @@ def load_used_collections():
     """
     Load used collections from USED_COLLECTIONS_FILE.
 
+    Expiration dates are stored as date ordinals. Entries written by older versions as
+    'YYYY-MM-DD' strings are converted on load.
+
     Returns:
-        dict: Dictionary of used collections.
+        dict: Dictionary mapping collection titles to expiration date ordinals.
     """
     if not os.path.exists(USED_COLLECTIONS_FILE):
         return {}
-    with open(USED_COLLECTIONS_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    used_collections = _read_json(USED_COLLECTIONS_FILE)
+    for name, expiration in list(used_collections.items()):
+        if isinstance(expiration, str):
+            try:
+                used_collections[name] = date.fromisoformat(expiration).toordinal()
+            except ValueError:
+                logging.warning(f"Dropping invalid expiration date '{expiration}' for collection '{name}'.")
+                del used_collections[name]
+    return used_collections
 
 def save_used_collections(used_collections):
     """
@@ -129,8 +280,7 @@ def save_used_collections(used_collections):
     Args:
         used_collections (dict): Dictionary of used collections to save.
     """
-    with open(USED_COLLECTIONS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(used_collections, f, ensure_ascii=False, indent=4)
+    _atomic_write_json(USED_COLLECTIONS_FILE, used_collections)
     logging.info("Used collections file saved.")
 
 def load_user_exemptions():
@@ -142,8 +292,7 @@ def load_user_exemptions():
     """
     if not os.path.exists(USER_EXEMPTIONS_FILE):
         return []
-    with open(USER_EXEMPTIONS_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _read_json(USER_EXEMPTIONS_FILE)
 
 def save_user_exemptions(user_exemptions):
     """
@@ -152,94 +301,87 @@ def save_user_exemptions(user_exemptions):
     Args:
         user_exemptions (list): List of user exemptions to save.
     """
-    with open(USER_EXEMPTIONS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(user_exemptions, f, ensure_ascii=False, indent=4)
+    _atomic_write_json(USER_EXEMPTIONS_FILE, user_exemptions)
     logging.info("User exemptions file saved.")
 
+def load_collection_cache():
+    """
+    Load the cached collection titles from COLLECTION_CACHE_FILE.
+
+    The cache is only an optimization, so a missing or unreadable file yields an empty cache.
+
+    Returns:
+        dict: Library title -> {"updatedAt": section timestamp, "titles": [collection titles]}.
+    """
+    if not os.path.exists(COLLECTION_CACHE_FILE):
+        return {}
+    try:
+        cache = _read_json(COLLECTION_CACHE_FILE)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable collection cache: {e}")
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_collection_cache(cache):
+    """
+    Save the cached collection titles to COLLECTION_CACHE_FILE.
+
+    Args:
+        cache (dict): Library title -> {"updatedAt": section timestamp, "titles": [collection titles]}.
+    """
+    _atomic_write_json(COLLECTION_CACHE_FILE, cache)
+    logging.info("Collection cache file saved.")
+
 def reset_exclusion_list_file():
     """
     Reset the exclusion list by clearing USED_COLLECTIONS_FILE.
     """
-    with open(USED_COLLECTIONS_FILE, 'w', encoding='utf-8') as f:
-        f.write("{}")
+    _atomic_write_json(USED_COLLECTIONS_FILE, {})
     logging.info("Exclusion list file has been reset.")
 
-def connect_to_plex(config):
+def connect_to_plex(config, timeout=None, connect_retries=3):
     """
     Connect to the Plex server using the provided configuration.
 
+    The returned server owns a pooled keep-alive session, so every request made through it
+    (for the whole lifetime of a main() run or the GUI) reuses open connections.
+
     Args:
         config (dict): Configuration dictionary containing Plex URL and token.
+        timeout (int, optional): Per-request timeout in seconds; plexapi's default if None.
+        connect_retries (int, optional): Retries for requests that fail to connect.
 
     Returns:
         PlexServer: Connected PlexServer instance.
     """
+    # Imported lazily: plexapi and requests are only needed once we actually talk to Plex
+    import requests
+    from plexapi.server import PlexServer
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
     logging.info("Connecting to Plex server...")
-    plex = PlexServer(config['plex_url'], config['plex_token'])
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                          max_retries=Retry(total=3, connect=connect_retries, backoff_factor=0.2))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    plex = PlexServer(config['plex_url'], config['plex_token'], session=session, timeout=timeout)
     logging.info("Connected to Plex server successfully.")
     return plex
 
-def handle_new_episodes_pinning(plex, libraries, always_pin_new_episodes):
+def _is_new_episodes(title):
     """
-    Handle pinning or unpinning of 'New Episodes' collections based on configuration.
+    Check whether a collection title is the 'New Episodes' collection (case-insensitive).
 
     Args:
-        plex (PlexServer): Connected PlexServer instance.
-        libraries (list): List of library names to process.
-        always_pin_new_episodes (bool): Flag to always pin 'New Episodes'.
-    """
-    logging.info("Handling 'New Episodes' collections...")
+        title (str): Collection title.
 
-    for library_name in libraries:
-        try:
-            library = plex.library.section(library_name)
-            for collection in library.collections():
-                if collection.title.lower() == "new episodes":
-                    if always_pin_new_episodes:
-                        try:
-                            hub = collection.visibility()
-                            hub.promoteHome()
-                            hub.promoteShared()
-                            logging.info(f"'New Episodes' collection pinned in '{library_name}'.")
-                        except Exception as e:
-                            logging.error(f"Error while pinning 'New Episodes': {e}")
-                    else:
-                        try:
-                            hub = collection.visibility()
-                            hub.demoteHome()
-                            hub.demoteShared()
-                            logging.info(f"'New Episodes' collection unpinned in '{library_name}'.")
-                        except Exception as e:
-                            logging.error(f"Error while unpinning 'New Episodes': {e}")
-                    break  # Assuming only one 'New Episodes' collection per library
-        except Exception as e:
-            logging.error(f"Error accessing library '{library_name}': {e}")
-
-def unpin_collections(plex, libraries, always_pin_new_episodes):
-    """
-    Unpin all collections except 'New Episodes' if always_pin_new_episodes is True.
-
-    Args:
-        plex (PlexServer): Connected PlexServer instance.
-        libraries (list): List of library names to process.
-        always_pin_new_episodes (bool): Flag to always pin 'New Episodes'.
+    Returns:
+        bool: True if the title names the 'New Episodes' collection.
     """
-    logging.info("Unpinning currently pinned collections...")
-
-    for library_name in libraries:
-        try:
-            library = plex.library.section(library_name)
-            for collection in library.collections():
-                if always_pin_new_episodes and collection.title.lower() == "new episodes":
-                    continue  # Skip 'New Episodes' if it's always pinned
-                try:
-                    hub = collection.visibility()
-                    hub.demoteHome()
-                    hub.demoteShared()
-                except Exception as e:
-                    logging.error(f"Error while unpinning collection '{collection.title}': {e}")
-        except Exception as e:
-            logging.error(f"Error accessing library '{library_name}': {e}")
+    # The length check rejects almost every title without allocating a lowercased copy
+    return len(title) == len(NEW_EPISODES_TITLE) and title.lower() == NEW_EPISODES_TITLE
 
 def log_and_update_exclusion_list(previous_pinned, used_collections, exclusion_days):
     """
@@ -250,50 +392,253 @@ def log_and_update_exclusion_list(previous_pinned, used_collections, exclusion_d
         used_collections (dict): Current exclusion list.
         exclusion_days (int): Number of days to exclude the collection.
     """
-    current_date = datetime.now().date()
+    expiration_date = date.today() + timedelta(days=exclusion_days)
+    expiration_ordinal = expiration_date.toordinal()
 
     for collection in previous_pinned:
-        expiration_date = (current_date + timedelta(days=exclusion_days)).strftime('%Y-%m-%d')
         logging.info(f"Adding collection '{collection.title}' to exclusion list (expires: {expiration_date}).")
-        used_collections[collection.title] = expiration_date
+        used_collections[collection.title] = expiration_ordinal
 
-    save_used_collections(used_collections)
+    # The in-memory list stays current; the next save writes it out, so don't stop the automation loop
+    try:
+        save_used_collections(used_collections)
+    except OSError as e:
+        logging.error(f"Failed to save exclusion list: {e}")
 
-def get_current_time_block(config, library_name):
+def _parse_hhmm(value):
     """
-    Determine the current time block and its corresponding limit for a given library.
+    Convert an 'HH:MM' string into minutes since midnight.
+
+    Args:
+        value (str): Time string in HH:MM format.
+
+    Returns:
+        int: Minutes since midnight.
+
+    Raises:
+        ValueError: If the string is not a valid HH:MM time.
+    """
+    hours, minutes = map(int, value.split(":"))
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError(f"Time out of range: '{value}'")
+    return hours * 60 + minutes
+
+def _compile_schedule(config):
+    """
+    Precompute every library's time blocks into per-weekday tables sorted by start time.
 
     Args:
         config (dict): Configuration dictionary.
+
+    Returns:
+        dict: {library_name: {weekday: (start_minutes, max_end_minutes, blocks)}} where blocks is a
+              list of (start_minute, end_minute, limit, block_name, config_order) tuples sorted by
+              start, and max_end_minutes[i] is the latest end among blocks[:i + 1].
+    """
+    default_limits = config.get("default_limits", {})
+    compiled = {}
+
+    for library_name, settings in config.get("libraries_settings", {}).items():
+        library_default_limit = default_limits.get(library_name, 5)
+        days = {}
+        for day, day_blocks in settings.get("time_blocks", {}).items():
+            if day not in WEEKDAYS or not isinstance(day_blocks, dict):
+                logging.error(f"Invalid time_blocks for day '{day}' in library '{library_name}'")
+                continue
+
+            blocks = []
+            for order, (block, details) in enumerate(day_blocks.items()):
+                try:
+                    start = _parse_hhmm(details["start_time"])
+                    end = _parse_hhmm(details["end_time"])
+                except (KeyError, TypeError, ValueError):
+                    logging.warning(f"Invalid time block '{block}' for {day} in library '{library_name}'. Skipping.")
+                    continue
+                blocks.append((start, end, details.get("limit", library_default_limit), block, order))
+
+            blocks.sort(key=lambda entry: entry[0])
+            max_ends = []
+            for entry in blocks:
+                max_ends.append(max(entry[1], max_ends[-1]) if max_ends else entry[1])
+            days[WEEKDAYS.index(day)] = ([entry[0] for entry in blocks], max_ends, blocks)
+        compiled[library_name] = days
+
+    return compiled
+
+def _lookup_block(compiled, library_name, now, default_limit=5):
+    """
+    Find the time block active at `now` in a schedule built by _compile_schedule.
+
+    If blocks overlap, the one listed first in the config wins.
+
+    Args:
+        compiled (dict): Compiled schedule.
         library_name (str): Name of the library.
+        now (datetime): Moment to look up.
+        default_limit (int, optional): Limit returned when no block matches.
 
     Returns:
         tuple: (current_block_name, limit)
     """
-    now = datetime.now()
-    current_day = now.strftime("%A")  # e.g., "Monday"
-    current_time = now.strftime("%H:%M")
+    day_table = compiled.get(library_name, {}).get(now.weekday())
+    if day_table:
+        starts, max_ends, blocks = day_table
+        current_minute = now.hour * 60 + now.minute
+
+        # Walk back from the latest block that has started; earlier blocks can only still be
+        # running while the latest end among them is after the current minute
+        match = None
+        index = bisect.bisect_right(starts, current_minute) - 1
+        while index >= 0 and max_ends[index] > current_minute:
+            start, end, limit, block, order = blocks[index]
+            if current_minute < end and (match is None or order < match[0]):
+                match = (order, block, limit)
+            index -= 1
+        if match is not None:
+            return match[1], match[2]
+
+    return "Default", default_limit
+
+def _pin_collection(collection):
+    """
+    Pin a collection to Home and Shared.
 
-    # Access library-specific settings
-    library_settings = config.get("libraries_settings", {}).get(library_name, {})
-    time_blocks = library_settings.get("time_blocks", {})
-    default_limits = config.get("default_limits", {})
-    library_default_limit = default_limits.get(library_name, 5)
+    Args:
+        collection (Collection): Plex collection to pin.
 
-    day_blocks = time_blocks.get(current_day, {})
-    if not isinstance(day_blocks, dict):
-        logging.error(f"Invalid time_blocks for day '{current_day}' in library '{library_name}'")
-        return "Default", library_default_limit
+    Returns:
+        bool: True if the collection was pinned, False otherwise.
+    """
+    try:
+        hub = collection.visibility()
+        hub.promoteHome()
+        hub.promoteShared()
+        logging.info(f"Collection '{collection.title}' pinned successfully.")
+        return True
+    except Exception as e:
+        logging.error(f"Error pinning collection '{collection.title}': {e}")
+        return False
 
-    for block, details in day_blocks.items():
-        if details.get("start_time") <= current_time < details.get("end_time"):
-            return block, details.get("limit", library_default_limit)
+def _unpin_collection(collection):
+    """
+    Unpin a collection from Home and Shared.
 
-    return "Default", library_default_limit
+    Args:
+        collection (Collection): Plex collection to unpin.
 
-# ------------------------------ Main Automation Function ------------------------------
+    Returns:
+        bool: True if the collection was unpinned, False otherwise.
+    """
+    try:
+        hub = collection.visibility()
+        hub.demoteHome()
+        hub.demoteShared()
+        return True
+    except Exception as e:
+        logging.error(f"Error while unpinning collection '{collection.title}': {e}")
+        return False
 
-import random
+def _reconcile_library(plex, config, schedule, library_name, used_collections, user_exemptions,
+                       min_items, always_pin_new_episodes, rng, pin_pool):
+    """
+    Refresh the pinned collections of a single library in one pass.
+
+    The library's collections are fetched once and used to keep or drop 'New Episodes',
+    unpin the previous selection, and pick and pin a new one.
+
+    Args:
+        plex (PlexServer): Connected PlexServer instance.
+        config (dict): Configuration dictionary.
+        schedule (dict): Time block schedule built by _compile_schedule.
+        library_name (str): Name of the library.
+        used_collections (dict): Current exclusion list.
+        user_exemptions (frozenset): Collections the user never wants pinned.
+        min_items (int): Minimum number of items for a collection to be valid.
+        always_pin_new_episodes (bool): Flag to always pin 'New Episodes'.
+        rng (random.Random): Random generator used to pick collections.
+        pin_pool (ThreadPoolExecutor): Executor used for per-collection Plex requests.
+
+    Returns:
+        tuple: (pinned_collections, reset_needed)
+    """
+    try:
+        logging.info(f"Processing library: {library_name}")
+        library = plex.library.section(library_name)
+        collections = library.collections()
+
+        # Split 'New Episodes' (assumed to be unique per library) from everything to unpin
+        new_episodes = None
+        to_unpin = []
+        for collection in collections:
+            if new_episodes is None and _is_new_episodes(collection.title):
+                new_episodes = collection
+                if always_pin_new_episodes:
+                    continue
+            to_unpin.append(collection)
+
+        if new_episodes is not None and always_pin_new_episodes and _pin_collection(new_episodes):
+            logging.info(f"'New Episodes' collection pinned in '{library_name}'.")
+
+        list(pin_pool.map(_unpin_collection, to_unpin))
+
+        # Determine the current time block and limit
+        current_block, current_limit = _lookup_block(
+            schedule, library_name, datetime.now(), config.get("default_limits", {}).get(library_name, 5)
+        )
+        logging.info(f"Library '{library_name}' - Time Block: {current_block}, Limit: {current_limit}")
+
+        # Retrieve the default limit if no time block matches
+        library_settings = config.get("libraries_settings", {}).get(library_name, {})
+        default_limit = library_settings.get("default_limit", 5)
+
+        # Fallback if no valid time block limit found
+        final_limit = current_limit if current_block != "Default" else default_limit
+
+        # Filter valid collections for pinning (both lookups are hash-based: used_collections is a
+        # dict and user_exemptions a set)
+        candidates = [
+            collection for collection in collections
+            if collection.title not in used_collections
+               and collection.title not in user_exemptions
+        ]
+        # childCount comes with the collections listing; only fall back to fetching the items
+        # (in parallel) when the server did not report it
+        sizes = [getattr(collection, 'childCount', None) for collection in candidates]
+        missing = [index for index, size in enumerate(sizes) if size is None]
+        for index, size in zip(missing, pin_pool.map(lambda i: len(candidates[i].items()), missing)):
+            sizes[index] = size
+        valid_collections = [
+            collection for collection, size in zip(candidates, sizes) if size >= min_items
+        ]
+
+        if len(valid_collections) < final_limit:
+            logging.warning(
+                f"Not enough valid collections for '{library_name}'. "
+                f"Required: {final_limit}, Available: {len(valid_collections)}. Resetting exclusion list."
+            )
+            return [], True
+
+        if not valid_collections:
+            logging.info(f"No valid collections found for '{library_name}'. Skipping.")
+            return [], False
+
+        # Determine pin limit
+        pin_limit = min(len(valid_collections), final_limit)
+
+        # Randomly select collections to pin
+        collections_to_pin = rng.sample(valid_collections, pin_limit)
+
+        logging.info(f"Valid collections in '{library_name}': {[c.title for c in valid_collections]}")
+        logging.info("Selected collections to pin successfully.")
+
+        results = pin_pool.map(_pin_collection, collections_to_pin)
+        return [collection for collection, pinned in zip(collections_to_pin, results) if pinned], False
+
+    except Exception as e:
+        logging.error(f"Error processing library '{library_name}': {e}")
+        return [], False
+
+# ------------------------------ Main Automation Function ------------------------------
 
 def main(gui_instance=None, stop_event=None):
     """
@@ -302,6 +647,9 @@ def main(gui_instance=None, stop_event=None):
     """
     logging.info("Starting DynamiX automation...")
 
+    if stop_event is None:
+        stop_event = threading.Event()
+
     try:
         # Load configuration
         config = load_config()
@@ -324,94 +672,55 @@ def main(gui_instance=None, stop_event=None):
         # Load persistent state files
         used_collections = load_used_collections()
         user_exemptions = load_user_exemptions()
+        user_exemptions_set = frozenset(user_exemptions)  # O(1) membership in the candidate filter
+
+        # Resolve the time block tables once instead of walking the config every iteration
+        schedule = _compile_schedule(config)
 
-        # Initialize SystemRandom for better randomness
-        sys_random = random.SystemRandom()
+        # Seed a regular PRNG from the OS once; picking collections is not a security boundary,
+        # so there is no need for SystemRandom's per-call urandom syscalls
+        rng = random.Random(os.urandom(16))
 
         logging.info("Entering main automation loop.")
         while not stop_event.is_set():
-            current_date = datetime.now().date()
+            today = date.today().toordinal()
 
             # Step 1: Clean up expired exclusions
             logging.info("Cleaning up expired exclusions...")
+            previous_count = len(used_collections)
             used_collections = {
-                name: date for name, date in used_collections.items()
-                if datetime.strptime(date, '%Y-%m-%d').date() > current_date
+                name: expiration for name, expiration in used_collections.items()
+                if expiration > today
             }
-            save_used_collections(used_collections)
-            logging.info("Updated exclusion list.")
-
-            # Step 2: Handle 'New Episodes' Pinning
-            handle_new_episodes_pinning(plex, libraries, always_pin_new_episodes)
-
-            # Step 3: Unpin existing collections
-            unpin_collections(plex, libraries, always_pin_new_episodes)
-
-            # Step 4: Pin new collections based on time blocks
-            logging.info("Pinning new collections based on current time block...")
+            if len(used_collections) != previous_count:  # Only rewrite the file when entries expired
+                try:
+                    save_used_collections(used_collections)
+                    logging.info("Updated exclusion list.")
+                except OSError as e:
+                    logging.error(f"Failed to save exclusion list: {e}")
+
+            # Step 2: Unpin the previous selection and pin new collections based on time blocks,
+            # handling 'New Episodes' in the same pass over each library
+            logging.info("Repinning collections based on current time block...")
             previous_pinned = []
             reset_needed = False  # Flag to determine if reset is required
 
-            for library_name in libraries:
-                try:
-                    logging.info(f"Processing library: {library_name}")
-                    library = plex.library.section(library_name)
-                    collections = library.collections()
-
-                    # Determine the current time block and limit
-                    current_block, current_limit = get_current_time_block(config, library_name)
-                    logging.info(f"Library '{library_name}' - Time Block: {current_block}, Limit: {current_limit}")
-
-                    # Retrieve the default limit if no time block matches
-                    library_settings = config.get("libraries_settings", {}).get(library_name, {})
-                    default_limit = library_settings.get("default_limit", 5)
-
-                    # Fallback if no valid time block limit found
-                    final_limit = current_limit if current_block != "Default" else default_limit
-
-                    # Filter valid collections for pinning
-                    valid_collections = [
-                        collection for collection in collections
-                        if len(collection.items()) >= min_items
-                           and collection.title not in used_collections
-                           and collection.title not in user_exemptions
-                    ]
-
-                    if len(valid_collections) < final_limit:
-                        logging.warning(
-                            f"Not enough valid collections for '{library_name}'. "
-                            f"Required: {final_limit}, Available: {len(valid_collections)}. Resetting exclusion list."
-                        )
-                        reset_needed = True
-                        break  # Exit the loop to reset the exclusion list
-
-                    if not valid_collections:
-                        logging.info(f"No valid collections found for '{library_name}'. Skipping.")
-                        continue
-
-                    # Determine pin limit
-                    pin_limit = min(len(valid_collections), final_limit)
-
-                    # Randomly select collections to pin using SystemRandom
-                    collections_to_pin = sys_random.sample(valid_collections, pin_limit)
-
-                    logging.info(f"Valid collections in '{library_name}': {[c.title for c in valid_collections]}")
-                    logging.info("Selected collections to pin successfully.")
-
-                    for collection in collections_to_pin:
-                        try:
-                            hub = collection.visibility()
-                            hub.promoteHome()
-                            hub.promoteShared()
-                            previous_pinned.append(collection)
-                            logging.info(f"Collection '{collection.title}' pinned successfully.")
-                        except Exception as e:
-                            logging.error(f"Error pinning collection '{collection.title}': {e}")
+            # Libraries are independent and I/O-bound, so query them concurrently
+            with ThreadPoolExecutor(max_workers=min(16, max(1, len(libraries) * 4))) as library_pool, \
+                    ThreadPoolExecutor(max_workers=8) as pin_pool:
+                def process(library_name):
+                    if stop_event.is_set():
+                        return [], False  # Closing; don't start requests for the remaining libraries
+                    return _reconcile_library(
+                        plex, config, schedule, library_name, used_collections, user_exemptions_set,
+                        min_items, always_pin_new_episodes, rng, pin_pool
+                    )
 
-                except Exception as e:
-                    logging.error(f"Error processing library '{library_name}': {e}")
+                for pinned, library_reset_needed in library_pool.map(process, libraries):
+                    previous_pinned.extend(pinned)
+                    reset_needed = reset_needed or library_reset_needed
 
-            # Step 4.1: Reset exclusion list if needed
+            # Step 2.1: Reset exclusion list if needed
             if reset_needed:
                 if gui_instance:
                     logging.info("Resetting exclusion list due to insufficient collections.")
@@ -424,7 +733,7 @@ def main(gui_instance=None, stop_event=None):
                 # Optionally, continue to the next iteration to retry pinning immediately
                 continue  # Skip the rest of the loop and restart
 
-            # Step 5: Pin selected collections
+            # Step 3: Record pinned collections
             if previous_pinned:
                 # Update exclusion list with newly pinned collections
                 log_and_update_exclusion_list(previous_pinned, used_collections, exclusion_days)
@@ -435,9 +744,11 @@ def main(gui_instance=None, stop_event=None):
             if gui_instance:
                 gui_instance.after(0, gui_instance.refresh_exclusion_list)
 
-            # Sleep for the configured pinning interval
+            # Sleep for the configured pinning interval, waking up immediately if asked to stop
             logging.info(f"Sleeping for {pinning_interval // 60} minutes before next iteration.")
-            time.sleep(pinning_interval)
+            if stop_event.wait(pinning_interval):
+                logging.info("Stop event received during sleep.")
+                break
 
     except Exception as e:
         logging.error(f"An error occurred: {e}")
@@ -453,19 +764,22 @@ class GuiHandler(logging.Handler):
     Custom logging handler for displaying logs in the GUI using a queue.
     """
 
-    def __init__(self, log_queue):
+    def __init__(self, log_queue, app=None):
         """
         Initialize the GuiHandler with a queue.
 
         Args:
             log_queue (queue.Queue): Queue to hold log messages.
+            app (tk.Tk, optional): Application whose process_log_queue_once drains the queue.
         """
         super().__init__()
         self.log_queue = log_queue
+        self._app_ref = weakref.ref(app) if app is not None else None
+        self._drain_scheduled = False
 
     def emit(self, record):
         """
-        Enqueue the log message.
+        Enqueue the log message; handle() schedules the drain.
 
         Args:
             record (logging.LogRecord): Log record.
@@ -473,6 +787,60 @@ class GuiHandler(logging.Handler):
         msg = self.format(record)
         self.log_queue.put(msg)
 
+    def handle(self, record):
+        """
+        Emit the record under the handler lock, then schedule a drain on the Tk main loop.
+
+        From a worker thread, after() waits for the Tk thread to service the call. It must not
+        run while the handler lock is held, or a Tk-thread log call would deadlock against it.
+
+        Args:
+            record (logging.LogRecord): Log record.
+
+        Returns:
+            bool: Whether the record passed the filters and was emitted.
+        """
+        emitted = super().handle(record)
+        if emitted:
+            self._schedule_drain()
+        return emitted
+
+    def _schedule_drain(self):
+        """
+        Ask the application to drain the queue on its main loop, unless a drain is already pending.
+        """
+        # Only one pending drain per burst; drain() clears the flag
+        if self._drain_scheduled or self._app_ref is None:
+            return
+        app = self._app_ref()
+        if app is None:
+            return
+        self._drain_scheduled = True
+        try:
+            app.after(0, app.process_log_queue_once)
+        except (RuntimeError, tk.TclError):
+            # Main loop not running (yet) or window already destroyed
+            self._drain_scheduled = False
+
+    def drain(self, max_items=LOG_DRAIN_BATCH):
+        """
+        Dequeue up to max_items pending messages without blocking.
+
+        Args:
+            max_items (int, optional): Maximum number of messages to dequeue.
+
+        Returns:
+            list: The dequeued messages; fewer than max_items means the queue was emptied.
+        """
+        self._drain_scheduled = False
+        lines = []
+        try:
+            for _ in range(max_items):
+                lines.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        return lines
+
 # ------------------------------ Scrollable Frame Class ------------------------------
 
 class ScrollableFrame(ttk.Frame):
@@ -494,10 +862,9 @@ class ScrollableFrame(ttk.Frame):
 
         # Configure canvas scroll region
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self._last_bbox = None
+        self._update_pending = False
+        self.scrollable_frame.bind("<Configure>", lambda e: self._schedule_update())
 
         # Create window inside the canvas
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
@@ -506,6 +873,27 @@ class ScrollableFrame(ttk.Frame):
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
+    def _schedule_update(self):
+        """
+        Schedule a scroll region update for when the event loop is idle.
+
+        A burst of <Configure> events (e.g. while many child widgets are added) results in
+        a single update.
+        """
+        if not self._update_pending:
+            self._update_pending = True
+            self.canvas.after_idle(self._do_update)
+
+    def _do_update(self):
+        """
+        Update the canvas scroll region if the inner frame's bounding box changed.
+        """
+        self._update_pending = False
+        bbox = self.canvas.bbox("all")
+        if bbox != self._last_bbox:
+            self.canvas.configure(scrollregion=bbox)
+            self._last_bbox = bbox
+
     def display_widget(self):
         """
         Return the inner scrollable frame.
@@ -515,6 +903,168 @@ class ScrollableFrame(ttk.Frame):
         """
         return self.scrollable_frame
 
+# ------------------------------ Virtual Check List Class ------------------------------
+
+class VirtualCheckList(ttk.Frame):
+    """
+    A scrollable list of checkboxes that only creates widgets for the visible rows.
+
+    A fixed pool of checkbuttons is rebound to different items as the list scrolls, so the
+    widget count stays constant no matter how many items the list holds. The mousewheel scrolls
+    the list while the pointer is over it; lists that fit entirely have no scrollbar and leave
+    wheel events to the enclosing canvas.
+    """
+
+    # Bind tag shared by every scrollable list, so the wheel bindings are created only once
+    WHEEL_TAG = "VirtualCheckListWheel"
+
+    def __init__(self, container, items, visible_rows=30, *args, **kwargs):
+        """
+        Initialize the VirtualCheckList.
+
+        Args:
+            container (tk.Widget): Parent widget.
+            items (list): (text, variable) pairs to display, in order.
+            visible_rows (int, optional): Maximum number of rows rendered at once.
+        """
+        super().__init__(container, *args, **kwargs)
+        self.items = items
+        self.first = 0
+        self._wheel_steps = 0  # Wheel steps not yet applied
+        self._wheel_after_id = None
+
+        self.rows_frame = ttk.Frame(self)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.rows_frame.pack(side="left", fill="both", expand=True)
+
+        # Create the pool of row widgets once; scrolling only reconfigures them
+        self.pool = []
+        for _ in range(min(visible_rows, len(items))):
+            checkbutton = ttk.Checkbutton(self.rows_frame)
+            checkbutton.pack(fill="x", pady=2)
+            self.pool.append(checkbutton)
+
+        # Scrolling is only needed when some items are not in the pool
+        if len(items) > len(self.pool):
+            self.scrollbar.pack(side="right", fill="y")
+            # Bound through the root: a binding made through this list would lose its Tcl
+            # command when the list is destroyed
+            root = self._root()
+            if not root.bind_class(self.WHEEL_TAG):
+                for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                    root.bind_class(self.WHEEL_TAG, sequence, VirtualCheckList._dispatch_mousewheel)
+            for widget in (self, self.rows_frame, *self.pool):
+                tags = widget.bindtags()
+                widget.bindtags((tags[0], self.WHEEL_TAG) + tags[1:])
+
+        self._show(0)
+
+    @staticmethod
+    def _dispatch_mousewheel(event):
+        """
+        Forward a wheel event on the shared bind tag to the list containing the widget.
+
+        Args:
+            event (tk.Event): MouseWheel or X11 Button-4/5 event.
+
+        Returns:
+            str: The result of _on_mousewheel, or None if no list contains the widget.
+        """
+        widget = event.widget
+        while widget is not None and not isinstance(widget, VirtualCheckList):
+            widget = getattr(widget, "master", None)
+        if widget is None:
+            return None
+        return widget._on_mousewheel(event)
+
+    def _on_mousewheel(self, event):
+        """
+        Scroll the list by one row per wheel notch, coalescing bursts of wheel events.
+
+        Args:
+            event (tk.Event): MouseWheel or X11 Button-4/5 event.
+
+        Returns:
+            str: "break" so the enclosing canvas does not scroll as well.
+        """
+        if event.num == 4:  # X11 scroll up
+            self._wheel_steps -= 1
+        elif event.num == 5:  # X11 scroll down
+            self._wheel_steps += 1
+        else:
+            self._wheel_steps -= event.delta // 120
+        if self._wheel_after_id is None:
+            self._wheel_after_id = self.after(WHEEL_COALESCE_MS, self._flush_wheel)
+        return "break"
+
+    def _flush_wheel(self):
+        """
+        Apply the wheel steps accumulated since the first event of the burst.
+        """
+        steps, self._wheel_steps = self._wheel_steps, 0
+        self._wheel_after_id = None
+        if steps:
+            self.yview("scroll", steps, "units")
+
+    def yview(self, *args):
+        """
+        Scroll the list; accepts the same arguments a scrollbar passes to its command.
+
+        Args:
+            *args: ("moveto", fraction) or ("scroll", count, "units" | "pages").
+        """
+        if args[0] == "moveto":
+            first = round(float(args[1]) * len(self.items))
+        else:
+            step = len(self.pool) if args[2] == "pages" else 1
+            first = self.first + int(args[1]) * step
+        self._show(min(max(first, 0), len(self.items) - len(self.pool)))
+
+    def _rebind_rows_proc(self):
+        """
+        Return the name of the Tcl procedure that reconfigures pooled rows, defining it on first use.
+
+        Returns:
+            str: Procedure name taking a flat list of widget, text, variable and style values.
+        """
+        if not self.tk.call("info", "procs", VIRTUAL_LIST_REBIND_PROC):
+            self.tk.eval(
+                f"proc {VIRTUAL_LIST_REBIND_PROC} {{rows}} {{\n"
+                "    foreach {widget text variable style} $rows {\n"
+                "        $widget configure -text $text -variable $variable -style $style\n"
+                "    }\n"
+                "}"
+            )
+        return VIRTUAL_LIST_REBIND_PROC
+
+    def _show(self, first):
+        """
+        Bind the pooled rows to the items starting at index first.
+
+        Args:
+            first (int): Index of the first visible item.
+        """
+        self.first = first
+        rows = []
+        for offset, checkbutton in enumerate(self.pool):
+            index = first + offset
+            text, variable = self.items[index]
+
+            # Alternate background colors for better readability (styles set up by DynamiXGUI)
+            style = "Even.TCheckbutton" if index % 2 == 0 else "Odd.TCheckbutton"
+            rows.extend((str(checkbutton), text, str(variable), style))
+
+        # Reconfigure the whole pool in one Tcl call; the tuple is passed as a proper Tcl list,
+        # so titles need no quoting
+        if rows:
+            self.tk.call(self._rebind_rows_proc(), tuple(rows))
+
+        total = len(self.items)
+        if total:
+            self.scrollbar.set(first / total, (first + len(self.pool)) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
 # ------------------------------ GUI Application Class ------------------------------
 
 class DynamiXGUI(tk.Tk):
@@ -538,7 +1088,13 @@ class DynamiXGUI(tk.Tk):
         self.center_window(920, 875)
 
         # Apply ttkbootstrap style
+        from ttkbootstrap import Style  # Also enables the bootstyle= option on ttk widgets
         self.style = Style(theme="darkly")
+        # Shared style for the small red hint labels under fields
+        self.style.configure("Hint.TLabel", font=("Segoe UI", 9, "italic"), foreground="red")
+        # Alternating row styles for the exemption checkbox lists
+        self.style.configure("Even.TCheckbutton", background="white", foreground="black")
+        self.style.configure("Odd.TCheckbutton", background="lightgray", foreground="black")
         self.configure(bg="black")
 
         # Initialize variables and state
@@ -548,15 +1104,141 @@ class DynamiXGUI(tk.Tk):
         self.user_exemptions = load_user_exemptions() or []
         self.user_exemption_checkboxes = {}
         self.plex = None
+        self._collections_cache = None  # Loaded from COLLECTION_CACHE_FILE by the first exemptions fetch
+        self._collections_cache_dirty = False  # In-memory cache has entries not yet saved
+        self._collections_cache_lock = threading.Lock()  # Serializes cache file writes between workers
+        self._refresh_token = 0  # Incremented per exemptions refresh; stale results are ignored
+        self._exemption_frames = {}  # library name -> LabelFrame in the User Exemptions tab
+        self._exemption_vars = {}  # (library name, collection title) -> IntVar, kept across refreshes
+        self._dirty_libraries = set()  # Libraries with checkbox changes since they were loaded or saved
+        self._summary_after_id = None  # Pending debounced library-selection refresh
         self.log_queue = queue.Queue()  # Queue for log messages
+        self.ui_queue = queue.Queue()  # Results from background workers, applied on the Tk thread
+        self._ui_drain_scheduled = False  # A process_ui_queue call is already pending on the Tk loop
+        self._net_pool = ThreadPoolExecutor(max_workers=2)  # Network I/O kept off the Tk thread
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=8)  # Collection prefetch, kept apart from _net_pool
+        self._prefetch_futures = {}  # Library title -> Future of its collection prefetch
+        self._server_name_cache = {}  # (plex_url, plex_token) -> (fetched_at, label text)
+        self._server_name_text = "Server Name: Fetching..."  # Shown when the Server tab gets built
+        self._pending_used_collections = None  # Background-loaded exclusions awaiting the Exclusion tab
+        self._tab_built = {"server": False, "settings": False, "exclusion": False, "exemptions": False}
+        self._config_dirty = False  # self.config has changes not yet written to CONFIG_FILE
+        self._save_after_id = None  # Pending debounced config write
 
         # Default font settings
         self.default_font = tkfont.Font(family="Segoe UI", size=30)
 
-        # Initialize UI components
+        # Start reading the exclusions file now so it overlaps with widget creation and the
+        # server name request; the Exclusion List tab is filled once process_ui_queue gets it
+        used_collections_future = self._net_pool.submit(load_used_collections)
+        used_collections_future.add_done_callback(
+            lambda future: self._post_ui("used_collections", future.result())
+        )
+
+        # Initialize UI components (the User Exemptions tab loads from Plex when first opened)
         self.create_widgets()
-        self.refresh_user_exemptions()
-        self.refresh_exclusion_list()
+        self._fetch_and_display_server_name()
+
+        # Pick up anything posted before the main loop started
+        self.after(0, self.process_ui_queue)
+
+        # Write any pending config changes before the window goes away
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _schedule_save_config(self):
+        """
+        Mark the config as changed and write it at most once per 200 ms burst of saves.
+        """
+        self._config_dirty = True
+        if self._save_after_id is None:
+            self._save_after_id = self.after(200, self._flush_config)
+
+    def _flush_config(self):
+        """
+        Write the config to disk now if it has unsaved changes.
+        """
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        try:
+            save_config(self.config)
+        except Exception as e:
+            # Keep the changes pending so the next save or closing the window retries the write
+            self._config_dirty = True
+            messagebox.showerror("Error", f"Failed to save configuration: {e}")
+
+    def _on_close(self):
+        """
+        Flush pending config changes, stop background work and close the window.
+
+        Pool workers are joined when the interpreter exits, so queued requests are cancelled
+        here; only requests already in flight are waited for.
+        """
+        self._flush_config()
+        self.stop_event.set()  # The automation loop skips libraries it has not started yet
+        self._net_pool.shutdown(wait=False, cancel_futures=True)
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
+    def _bind_mousewheel(self, canvas):
+        """
+        Bind mousewheel scrolling for a canvas to a bind tag of its own.
+
+        Wheel events go to the widget under the pointer, so the tag has to be added to the
+        canvas content with _add_mousewheel_tag. Nothing is bound globally.
+
+        Args:
+            canvas (tk.Canvas): Canvas to scroll.
+
+        Returns:
+            str: The bind tag carrying the wheel bindings.
+        """
+        tag = f"{canvas}.wheel"
+        wheel = {"steps": 0, "after_id": None}  # Steps accumulated during the current burst
+
+        def _flush_wheel():
+            steps, wheel["steps"], wheel["after_id"] = wheel["steps"], 0, None
+            if steps:
+                canvas.yview_scroll(steps, "units")
+
+        def _on_mousewheel(event):
+            # Accumulate and scroll once per WHEEL_COALESCE_MS instead of once per event
+            if event.num == 4:  # X11 scroll up
+                wheel["steps"] -= 1
+            elif event.num == 5:  # X11 scroll down
+                wheel["steps"] += 1
+            else:
+                wheel["steps"] -= event.delta // 120
+            if wheel["after_id"] is None:
+                wheel["after_id"] = canvas.after(WHEEL_COALESCE_MS, _flush_wheel)
+            return "break"
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            canvas.bind_class(tag, sequence, _on_mousewheel)
+        self._add_mousewheel_tag(canvas, tag)
+        return tag
+
+    def _add_mousewheel_tag(self, widget, tag):
+        """
+        Add a wheel bind tag from _bind_mousewheel to a widget and all of its descendants.
+
+        Args:
+            widget (tk.Widget): Root of the widget tree to tag.
+            tag (str): Bind tag to add.
+        """
+        pending = [widget]
+        while pending:
+            current = pending.pop()
+            tags = current.bindtags()
+            if tag not in tags:
+                # Just before the class tag, so tags of nested scrollable widgets get the event first
+                widget_class = current.winfo_class()
+                index = tags.index(widget_class) if widget_class in tags else 1
+                current.bindtags(tags[:index] + (tag,) + tags[index:])
+            pending.extend(current.winfo_children())
 
     def center_window(self, width, height):
         """
@@ -606,12 +1288,28 @@ class DynamiXGUI(tk.Tk):
         # Pack the tab control
         self.tab_control.pack(expand=True, fill="both")
 
-        # Initialize content for each tab
-        self._create_server_tab()
-        self._create_settings_tab()
+        # Logs are needed right away; the other tabs are built on first visit, so the exemptions
+        # tab only connects to Plex once it is opened
         self._create_logs_tab()
-        self._create_exclusion_tab()
-        self._create_user_exemptions_tab()
+        self._lazy_tabs = {
+            str(self.server_tab): ("server", self._create_server_tab),
+            str(self.settings_tab): ("settings", self._create_settings_tab),
+            str(self.exclusion_tab): ("exclusion", self._create_exclusion_tab),
+            str(self.user_exemptions_tab): ("exemptions", self._create_user_exemptions_tab),
+        }
+        self.tab_control.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event=None):
+        """
+        Build the selected tab's widgets the first time it is shown.
+        """
+        lazy_tab = self._lazy_tabs.get(self.tab_control.select())
+        if lazy_tab is None:
+            return
+        name, create_tab = lazy_tab
+        if not self._tab_built[name]:
+            self._tab_built[name] = True
+            create_tab()
 
     def _has_missing_fields(self):
         """
@@ -635,13 +1333,12 @@ class DynamiXGUI(tk.Tk):
         frame.pack(fill="both", expand=True)
 
         # Title Label
-        ttk.Label(frame, text="Fill in Missing Configuration Fields", font=("Segoe UI", 16, "bold")).pack(pady=10)
-
-        # Frame for missing fields
-        self.missing_fields_frame = ttk.Frame(frame)
-        self.missing_fields_frame.pack(fill="both", expand=True, pady=10)
+        self.missing_info_title = ttk.Label(frame, text="Fill in Missing Configuration Fields", font=("Segoe UI", 16, "bold"))
+        self.missing_info_title.pack(pady=10)
 
         # Populate Missing Fields
+        self.missing_info_frame = frame
+        self.missing_fields_frame = None
         self.missing_entries = {}
         self._populate_missing_fields()
 
@@ -666,8 +1363,7 @@ class DynamiXGUI(tk.Tk):
             explanation_label = ttk.Label(
                 explanation_frame,
                 text=plex_token_explanation,
-                font=("Segoe UI", 9, "italic"),
-                foreground="red",
+                style="Hint.TLabel",
                 wraplength=800,
                 justify="center",
                 anchor="center"  # Anchor text center within the label
@@ -682,9 +1378,11 @@ class DynamiXGUI(tk.Tk):
         """
         Populate the Missing Information tab with entry fields for missing configuration.
         """
-        # Clear previous fields
-        for widget in self.missing_fields_frame.winfo_children():
-            widget.destroy()
+        # Replace the previous fields frame wholesale; destroying the parent tears down all of its
+        # children in one call, and the new frame is only packed once it is fully built
+        if self.missing_fields_frame is not None:
+            self.missing_fields_frame.destroy()
+        self.missing_fields_frame = ttk.Frame(self.missing_info_frame)
         self.missing_entries = {}
 
         # Define the required fields with descriptions
@@ -696,9 +1394,8 @@ class DynamiXGUI(tk.Tk):
         }
 
         # Center grid columns for better alignment
-        self.missing_fields_frame.grid_columnconfigure(0, weight=1)  # Left padding
+        self.missing_fields_frame.grid_columnconfigure((0, 2), weight=1)  # Left/right padding
         self.missing_fields_frame.grid_columnconfigure(1, weight=2)  # Main content
-        self.missing_fields_frame.grid_columnconfigure(2, weight=1)  # Right padding
 
         # Dynamically add fields for missing/empty entries
         row = 0
@@ -735,9 +1432,11 @@ class DynamiXGUI(tk.Tk):
                 font=("Segoe UI", 12, "italic")
             ).grid(row=row, column=1, pady=20)
 
+        self.missing_fields_frame.pack(after=self.missing_info_title, fill="both", expand=True, pady=10)
+
     def _save_missing_fields(self):
         """
-        Save the newly filled missing fields to the config and restart the GUI.
+        Save the newly filled missing fields to the config and refresh the affected widgets.
         """
         try:
             # Update the config dictionary with new values
@@ -751,18 +1450,50 @@ class DynamiXGUI(tk.Tk):
                     self.config[key] = value
 
             # Save updated configuration
-            save_config(self.config)
+            self._schedule_save_config()
 
-            messagebox.showinfo("Success", "Missing information saved successfully! Restarting the application...")
-            logging.info("Missing configuration fields have been updated. Restarting the GUI.")
+            messagebox.showinfo("Success", "Missing information applied. It will be written to the config file shortly.")
+            logging.info("Missing configuration fields have been updated. Refreshing the GUI.")
 
-            # Restart the application
-            self.restart_program()
+            # Reflect the new values in the existing tabs instead of restarting the process
+            self._rebind_from_config()
 
         except Exception as e:
             logging.error(f"Error saving missing configuration fields: {e}")
             messagebox.showerror("Error", f"Failed to save missing information: {e}")
 
+    def _rebind_from_config(self):
+        """
+        Update the widgets that mirror config values after the config changed outside their tab.
+        """
+        # Entry fields created by the Server and Settings tabs, through their StringVars
+        for config_key in ("plex_url", "plex_token", "libraries", "pinning_interval", "exclusion_days", "minimum_items"):
+            var = getattr(self, f"{config_key}_var", None)
+            if var is None:
+                continue
+            value = self.config.get(config_key, "")
+            if config_key == "libraries" and isinstance(value, list):
+                value = ", ".join(value)
+            var.set(value)
+
+        # Library selector for time blocks and the schedule summary
+        if self._tab_built["settings"]:
+            self.library_dropdown.configure(values=self.config.get("libraries", []))
+            self._refresh_schedule_summary_now()
+
+        # Server details may have changed, so drop the old connection and reload what depends on it
+        self.plex = None
+        self._fetch_and_display_server_name()
+        if self._tab_built["exemptions"]:
+            self.refresh_user_exemptions()
+
+        # The Missing Information tab is no longer needed once everything is filled in
+        if self._has_missing_fields():
+            self._populate_missing_fields()
+        else:
+            self.tab_control.forget(self.missing_info_tab)
+            self.tab_control.select(self.logs_tab)
+
     def _create_server_tab(self):
         """
         Create the Plex Server configuration tab.
@@ -770,13 +1501,9 @@ class DynamiXGUI(tk.Tk):
         frame = ttk.Frame(self.server_tab, padding="10", style="TFrame")
         frame.pack(fill="both", expand=True)
 
-        # Configure rows/columns for proper layout and centering
-        for i in range(7):
-            frame.grid_rowconfigure(i, weight=0)
-        frame.grid_rowconfigure(0, weight=1)
-        frame.grid_rowconfigure(6, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
-        frame.grid_columnconfigure(1, weight=1)
+        # Configure rows/columns for proper layout and centering (other rows keep the default weight 0)
+        frame.grid_rowconfigure((0, 6), weight=1)
+        frame.grid_columnconfigure((0, 1), weight=1)
 
         # Title
         ttk.Label(
@@ -788,15 +1515,15 @@ class DynamiXGUI(tk.Tk):
 
         # Plex URL
         ttk.Label(frame, text="Plex URL (Can't be 'localhost'):", font=("Segoe UI", 12)).grid(row=2, column=0, sticky="e", padx=10, pady=5)
-        self.plex_url_entry = ttk.Entry(frame, width=50)
+        self.plex_url_var = tk.StringVar(value=self.config.get("plex_url", ""))
+        self.plex_url_entry = ttk.Entry(frame, width=50, textvariable=self.plex_url_var)
         self.plex_url_entry.grid(row=2, column=1, sticky="w", padx=10, pady=5)
-        self.plex_url_entry.insert(0, self.config.get("plex_url", ""))
 
         # Plex Token
         ttk.Label(frame, text="Plex Token:", font=("Segoe UI", 12)).grid(row=3, column=0, sticky="e", padx=10, pady=5)
-        self.plex_token_entry = ttk.Entry(frame, width=50, show="*")
+        self.plex_token_var = tk.StringVar(value=self.config.get("plex_token", ""))
+        self.plex_token_entry = ttk.Entry(frame, width=50, show="*", textvariable=self.plex_token_var)
         self.plex_token_entry.grid(row=3, column=1, sticky="w", padx=10, pady=5)
-        self.plex_token_entry.insert(0, self.config.get("plex_token", ""))
 
         # More in-depth explanation centered under the Plex Token field
         plex_token_explanation = (
@@ -810,14 +1537,10 @@ class DynamiXGUI(tk.Tk):
             "This token lets this tool manage your Plex server's collections securely."
         )
 
-        frame.grid_columnconfigure(0, weight=1)
-        frame.grid_columnconfigure(1, weight=1)
-
         explanation_label = ttk.Label(
             frame,
             text=plex_token_explanation,
-            font=("Segoe UI", 9, "italic"),
-            foreground="red",
+            style="Hint.TLabel",
             wraplength=600,
             justify="center",
             anchor="center"  # Anchor text center within the label
@@ -832,18 +1555,15 @@ class DynamiXGUI(tk.Tk):
             bootstyle="warning"
         ).grid(row=5, column=0, columnspan=2, pady=20)
 
-        # Server Name Label
+        # Server Name Label; the name itself is fetched at startup
         self.server_name_label = ttk.Label(
             frame,
-            text="Server Name: Fetching...",
+            text=self._server_name_text,
             font=("Segoe UI", 20, "bold"),
             bootstyle="warning"
         )
         self.server_name_label.grid(row=6, column=0, columnspan=2, pady=10)
 
-        # Fetch and display the Plex server name
-        self._fetch_and_display_server_name()
-
     def _save_and_refresh_server_name(self):
         """
         Save the server configuration and refresh the server name display.
@@ -856,16 +1576,16 @@ class DynamiXGUI(tk.Tk):
         Save the Plex server configuration from the server tab.
         """
         try:
-            plex_url = self.plex_url_entry.get().strip()
-            plex_token = self.plex_token_entry.get().strip()
+            plex_url = self.plex_url_var.get().strip()
+            plex_token = self.plex_token_var.get().strip()
             if not plex_url or not plex_token:
                 messagebox.showerror("Error", "Plex URL and Token cannot be empty.")
                 return
 
             self.config["plex_url"] = plex_url
             self.config["plex_token"] = plex_token
-            save_config(self.config)
-            messagebox.showinfo("Success", "Plex server configuration saved successfully.")
+            self._schedule_save_config()
+            messagebox.showinfo("Success", "Plex server configuration applied. It will be written to the config file shortly.")
             logging.info("Plex server configuration saved.")
         except Exception as e:
             logging.error(f"Error saving Plex server configuration: {e}")
@@ -873,24 +1593,64 @@ class DynamiXGUI(tk.Tk):
 
     def _fetch_and_display_server_name(self):
         """
-        Fetch the Plex server name and update the server name label.
+        Fetch the Plex server name in the background and update the server name label.
         """
-        plex_url = self.plex_url_entry.get()
-        plex_token = self.plex_token_entry.get()
+        if self._tab_built["server"]:
+            plex_url = self.plex_url_var.get()
+            plex_token = self.plex_token_var.get()
+        else:
+            plex_url = self.config.get("plex_url", "")
+            plex_token = self.config.get("plex_token", "")
 
         if plex_url and plex_token:
-            try:
-                response = requests.get(f"{plex_url}/?X-Plex-Token={plex_token}", timeout=10)
-                if response.status_code == 200:
-                    root = ET.fromstring(response.content)
-                    server_name = root.attrib.get("friendlyName", "Unknown Server")
-                    self.server_name_label.config(text=f"Server Name: {server_name}")
-                else:
-                    self.server_name_label.config(text="Server Name: Unable to fetch")
-            except Exception as e:
-                self.server_name_label.config(text=f"Server Name: Error fetching ({str(e)})")
+            cached = self._server_name_cache.get((plex_url, plex_token))
+            if cached and time.monotonic() - cached[0] < SERVER_NAME_CACHE_TTL:
+                self._show_server_name(cached[1])
+                return
+            self._show_server_name("Server Name: Fetching...")
+            self._net_pool.submit(self._fetch_server_name_worker, plex_url, plex_token)
         else:
-            self.server_name_label.config(text="Server Name: Missing URL or Token")
+            self._show_server_name("Server Name: Missing URL or Token")
+
+    def _show_server_name(self, text):
+        """
+        Remember the server name text and show it if the Server tab has been built.
+
+        Args:
+            text (str): Label text to display.
+        """
+        self._server_name_text = text
+        if self._tab_built["server"]:
+            self.server_name_label.config(text=text)
+
+    def _fetch_server_name_worker(self, plex_url, plex_token):
+        """
+        Fetch the Plex server name on a worker thread and post the label text to the UI queue.
+
+        Must not touch Tk widgets; process_ui_queue applies the result on the Tk thread.
+
+        Args:
+            plex_url (str): URL of the Plex server.
+            plex_token (str): Plex authentication token.
+        """
+        import requests
+
+        try:
+            response = requests.get(f"{plex_url}/?X-Plex-Token={plex_token}", timeout=10)
+            if response.status_code == 200:
+                # Only the root element's attributes are needed, so stop after its start tag
+                context = ET.iterparse(BytesIO(response.content), events=("start",))
+                _, root = next(context)
+                server_name = root.attrib.get("friendlyName", "Unknown Server")
+                del context
+                text = f"Server Name: {server_name}"
+                # Only successful lookups are cached so errors are retried on the next fetch
+                self._server_name_cache[(plex_url, plex_token)] = (time.monotonic(), text)
+            else:
+                text = "Server Name: Unable to fetch"
+        except Exception as e:
+            text = f"Server Name: Error fetching ({str(e)})"
+        self._post_ui("server_name", text)
 
     def _add_general_field(self, parent_frame, label_text, start_row, config_key, explanation=""):
         """
@@ -904,10 +1664,11 @@ class DynamiXGUI(tk.Tk):
         if config_key == "libraries" and isinstance(value, list):
             value = ", ".join(value)
 
-        entry = ttk.Entry(parent_frame, width=50)
+        var = tk.StringVar(value=value)
+        entry = ttk.Entry(parent_frame, width=50, textvariable=var)
         entry.grid(row=start_row, column=1, sticky="w", padx=10, pady=5)
-        entry.insert(0, value)
         setattr(self, f"{config_key}_entry", entry)
+        setattr(self, f"{config_key}_var", var)
 
         # Explanation Row
         next_row = start_row + 1
@@ -915,8 +1676,7 @@ class DynamiXGUI(tk.Tk):
             ttk.Label(
                 parent_frame,
                 text=explanation,
-                font=("Segoe UI", 9, "italic"),
-                foreground="red",
+                style="Hint.TLabel",
                 wraplength=600
             ).grid(row=next_row, column=0, columnspan=2, sticky="w", padx=10, pady=(0, 10))
             next_row += 1
@@ -931,6 +1691,10 @@ class DynamiXGUI(tk.Tk):
         Create the Settings tab with General Settings, Default Limits, and Time Block Configuration.
         Includes explanations for each setting and preserves the original scrolling functionality.
         """
+        # Config values used in several places below
+        libraries = self.config.get("libraries", [])
+        default_limits = self.config.get("default_limits", {})
+
         # Parent container for the settings tab
         container = ttk.Frame(self.settings_tab)
         container.pack(fill="both", expand=True)
@@ -947,13 +1711,8 @@ class DynamiXGUI(tk.Tk):
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        def _on_mousewheel(event):
-            canvas.yview_scroll(-1 * (event.delta // 120), "units")
-
-        # These lines remain EXACTLY as originally was
-        canvas.bind("<Enter>",
-                    lambda e: self.exemptions_canvas.bind_all("<MouseWheel>", _on_mousewheel))
-        canvas.bind("<Leave>", lambda e: self.exemptions_canvas.unbind_all("<MouseWheel>"))
+        # Mousewheel scrolling for this canvas only; tagged onto the content once it is built
+        self._settings_wheel_tag = self._bind_mousewheel(canvas)
 
         # Title
         ttk.Label(scrollable_frame, text="Settings", font=("Segoe UI", 24, "bold")).pack(pady=20)
@@ -1016,8 +1775,7 @@ class DynamiXGUI(tk.Tk):
         ttk.Label(
             general_config_frame,
             text="If checked, the 'New Episodes' collection will always be pinned if present.",
-            font=("Segoe UI", 9, "italic"),
-            foreground="red",
+            style="Hint.TLabel",
             wraplength=600
         ).grid(row=current_row, column=0, columnspan=2, sticky="w", padx=10, pady=(0, 10))
         current_row += 1
@@ -1029,18 +1787,17 @@ class DynamiXGUI(tk.Tk):
         ttk.Label(
             default_limits_frame,
             text="Set default pinning limits for each library when no specific time block applies:",
-            font=("Segoe UI", 9, "italic"), foreground="red", wraplength=600
+            style="Hint.TLabel", wraplength=600
         ).grid(row=0, column=0, columnspan=2, sticky="w", padx=10, pady=5)
 
         self.default_limit_entries = {}
-        libraries = self.config.get("libraries", [])
         dl_current_row = 1
         for library in libraries:
             ttk.Label(default_limits_frame, text=f"{library}:").grid(row=dl_current_row, column=0, padx=5, pady=5,
                                                                      sticky="e")
             entry = ttk.Entry(default_limits_frame, width=10)
             entry.grid(row=dl_current_row, column=1, padx=5, pady=5, sticky="w")
-            entry.insert(0, self.config.get("default_limits", {}).get(library, 5))
+            entry.insert(0, default_limits.get(library, 5))
             self.default_limit_entries[library] = entry
             dl_current_row += 1
 
@@ -1052,8 +1809,7 @@ class DynamiXGUI(tk.Tk):
         ttk.Label(
             time_block_frame,
             text="Configure different pinning limits based on the day and time of day.",
-            font=("Segoe UI", 9, "italic"),
-            foreground="red",
+            style="Hint.TLabel",
             wraplength=600
         ).grid(row=0, column=0, columnspan=7, pady=5, sticky="n")
 
@@ -1063,7 +1819,7 @@ class DynamiXGUI(tk.Tk):
         self.library_dropdown = ttk.Combobox(
             time_block_frame,
             textvariable=self.selected_library,
-            values=self.config.get("libraries", []),
+            values=libraries,
             state="readonly"
         )
         self.library_dropdown.grid(row=2, column=0, columnspan=7, padx=10, pady=5, sticky="ew")
@@ -1080,8 +1836,7 @@ class DynamiXGUI(tk.Tk):
             wraplength=600
         ).grid(row=0, column=0, columnspan=7, sticky="w", padx=10, pady=5)
 
-        for i in range(7):
-            days_frame.grid_columnconfigure(i, weight=1)
+        days_frame.grid_columnconfigure(tuple(range(7)), weight=1)
 
         self.day_vars = {}
         days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
@@ -1094,30 +1849,13 @@ class DynamiXGUI(tk.Tk):
         ttk.Label(
             time_block_frame,
             text="Define start/end times (HH:MM) and pin limits for each block.",
-            font=("Segoe UI", 9, "italic"), foreground="red", wraplength=600
+            style="Hint.TLabel", wraplength=600
         ).grid(row=4, column=0, columnspan=7, padx=10, pady=(0, 10), sticky="w")
 
         self.time_block_entries = {}
         blocks = ["Morning", "Afternoon", "Evening"]
         for idx, block_name in enumerate(blocks):
-            ttk.Label(time_block_frame, text=f"{block_name} Start:").grid(row=5 + idx, column=1, padx=5, pady=5,
-                                                                          sticky="e")
-            start_entry = ttk.Entry(time_block_frame, width=10)
-            start_entry.grid(row=5 + idx, column=2, padx=5, pady=5, sticky="w")
-
-            ttk.Label(time_block_frame, text="End:").grid(row=5 + idx, column=3, padx=5, pady=5, sticky="e")
-            end_entry = ttk.Entry(time_block_frame, width=10)
-            end_entry.grid(row=5 + idx, column=4, padx=5, pady=5, sticky="w")
-
-            ttk.Label(time_block_frame, text="Limit:").grid(row=5 + idx, column=5, padx=5, pady=5, sticky="e")
-            limit_entry = ttk.Entry(time_block_frame, width=5)
-            limit_entry.grid(row=5 + idx, column=6, padx=5, pady=5, sticky="w")
-
-            self.time_block_entries[block_name] = {
-                "start_time": start_entry,
-                "end_time": end_entry,
-                "limit": limit_entry
-            }
+            self.time_block_entries[block_name] = self._make_block_row(time_block_frame, 5 + idx, block_name)
 
         # --- Save Time Blocks Button ---
         save_time_blocks_button = ttk.Button(
@@ -1139,25 +1877,60 @@ class DynamiXGUI(tk.Tk):
             wraplength=600
         ).pack(anchor="w", pady=5, padx=10)
 
-        self._refresh_schedule_summary()
+        self._summary_widgets = {}  # (day, block_name) -> [label, text, pack_options]
+        self._summary_packed = []  # Labels currently packed, in display order
+        self._refresh_schedule_summary_now()
+
+        self._add_mousewheel_tag(scrollable_frame, self._settings_wheel_tag)
+
+    # (field key, label text, entry width) for each time block row; labels and entries alternate columns
+    _BLOCK_ROW_FIELDS = (
+        ("start_time", "{block_name} Start:", 10),
+        ("end_time", "End:", 10),
+        ("limit", "Limit:", 5),
+    )
+
+    def _make_block_row(self, frame, row, block_name):
+        """
+        Create the label/entry pairs for one time block on a grid row.
+
+        Args:
+            frame (ttk.Frame): Parent frame using the grid layout.
+            row (int): Grid row to place the widgets on.
+            block_name (str): Time block name shown in the first label.
+
+        Returns:
+            dict: Field key -> entry widget.
+        """
+        entries = {}
+        column = 1
+        for key, label_text, width in self._BLOCK_ROW_FIELDS:
+            ttk.Label(frame, text=label_text.format(block_name=block_name)).grid(
+                row=row, column=column, padx=5, pady=5, sticky="e"
+            )
+            entry = ttk.Entry(frame, width=width)
+            entry.grid(row=row, column=column + 1, padx=5, pady=5, sticky="w")
+            entries[key] = entry
+            column += 2
+        return entries
 
     def save_settings(self):
         """Save settings from the Settings tab to the config file."""
         try:
             # Correct attribute names based on config_key
-            self.config["minimum_items"] = int(self.minimum_items_entry.get())  # Corrected
-            self.config["exclusion_days"] = int(self.exclusion_days_entry.get())
+            self.config["minimum_items"] = int(self.minimum_items_var.get())
+            self.config["exclusion_days"] = int(self.exclusion_days_var.get())
             self.config["always_pin_new_episodes"] = self.new_episodes_var.get()
-            self.config["libraries"] = [lib.strip() for lib in self.libraries_entry.get().split(",") if lib.strip()]
-            self.config["pinning_interval"] = int(self.pinning_interval_entry.get())
+            self.config["libraries"] = [lib.strip() for lib in self.libraries_var.get().split(",") if lib.strip()]
+            self.config["pinning_interval"] = int(self.pinning_interval_var.get())
 
             # Save default limits
             self.config["default_limits"] = {}
             for library, entry in self.default_limit_entries.items():
                 self.config["default_limits"][library] = int(entry.get())
 
-            save_config(self.config)
-            messagebox.showinfo("Success", "Settings saved successfully!")
+            self._schedule_save_config()
+            messagebox.showinfo("Success", "Settings applied. They will be written to the config file shortly.")
             logging.info("Settings saved.")
         except ValueError:
             messagebox.showerror("Error", "Invalid input. Please enter valid integers.")
@@ -1177,66 +1950,65 @@ class DynamiXGUI(tk.Tk):
             messagebox.showwarning("Warning", "No library selected.")
             return
 
-        for day in selected_days:
-            time_blocks = {}
-            for block_name, entries in self.time_block_entries.items():
-                start_time = entries["start_time"].get().strip()
-                end_time = entries["end_time"].get().strip()
-                limit = entries["limit"].get().strip()
-
-                # Validate time format and numeric limits
-                if self._validate_time_format(start_time) and self._validate_time_format(end_time) and limit.isdigit():
-                    time_blocks[block_name] = {
-                        "start_time": start_time,
-                        "end_time": end_time,
-                        "limit": int(limit)
-                    }
-                else:
-                    messagebox.showerror(
-                        "Error",
-                        f"Invalid input in {block_name} block for {day}. Ensure time is HH:MM and limit is a number."
-                    )
-                    return
+        # The entries are shared by every selected day, so read and validate them once. Nothing is
+        # written to the config unless every block is valid.
+        template_time_blocks = {}
+        for block_name, entries in self.time_block_entries.items():
+            start_time = entries["start_time"].get().strip()
+            end_time = entries["end_time"].get().strip()
+            limit = entries["limit"].get().strip()
+
+            # Validate time format and numeric limits
+            if self._validate_time_format(start_time) and self._validate_time_format(end_time) and limit.isdigit():
+                template_time_blocks[block_name] = {
+                    "start_time": start_time,
+                    "end_time": end_time,
+                    "limit": int(limit)
+                }
+            else:
+                messagebox.showerror(
+                    "Error",
+                    f"Invalid input in {block_name} block. Ensure time is HH:MM and limit is a number."
+                )
+                return
 
-            self.config.setdefault("libraries_settings", {}).setdefault(library_name, {}).setdefault("time_blocks", {})[
-                day] = time_blocks
+        # Resolve the library's per-day time block mapping once for all selected days
+        library_time_blocks = self.config.setdefault("libraries_settings", {}).setdefault(
+            library_name, {}).setdefault("time_blocks", {})
+        for day in selected_days:
+            # Copy per day so later edits to one day do not alias the others
+            library_time_blocks[day] = {name: dict(details) for name, details in template_time_blocks.items()}
 
-        save_config(self.config)
-        self._refresh_schedule_summary()
-        messagebox.showinfo("Success", "Time blocks applied to selected days.")
+        self._schedule_save_config()
+        self._refresh_schedule_summary_now()
+        messagebox.showinfo("Success", "Time blocks applied to selected days. They will be written to the config file shortly.")
 
-    def _refresh_schedule_summary(self):
+    def _refresh_schedule_summary_now(self):
         """
         Refresh the summary table showing current time block settings.
-        """
-        # Clear existing widgets in the schedule summary frame
-        for widget in self.schedule_summary_frame.winfo_children():
-            widget.destroy()
 
-        # Get the selected library
+        Labels are pooled by (day, block_name) and reused across refreshes: only changed text is
+        reconfigured, and labels are only re-packed when the set or order of rows changes.
+        """
+        # Work out which rows should be shown, in display order
+        rows = []  # (key, text, label_options, pack_options)
         library_name = self.selected_library.get()
         if not library_name:
-            ttk.Label(self.schedule_summary_frame, text="No library selected.").pack()
-            return
-
-        # Fetch the time block settings for the library
-        library_settings = self.config.get("libraries_settings", {}).get(library_name, {})
-        time_blocks = library_settings.get("time_blocks", {})
+            rows.append(((None, None), "No library selected.", {}, {}))
+        else:
+            # Fetch the time block settings for the library
+            time_blocks = self._library_time_blocks(library_name)
 
-        # Display the time blocks for all days of the week
-        days_of_week = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+            # Display the time blocks for all days of the week
+            for day in WEEKDAYS:
+                rows.append(((day, None), f"{day}", {"font": ("Segoe UI", 10, "bold")}, {"anchor": "w", "pady": 2}))
 
-        for day in days_of_week:
-            # Display the day header
-            ttk.Label(self.schedule_summary_frame, text=f"{day}", font=("Segoe UI", 10, "bold")).pack(anchor="w",
-                                                                                                      pady=2)
+                # Fetch blocks for the current day
+                day_blocks = time_blocks.get(day, {})
+                if not day_blocks:
+                    rows.append(((day, ""), "  No blocks configured", {}, {"anchor": "w", "padx": 10, "pady": 1}))
+                    continue
 
-            # Fetch blocks for the current day
-            day_blocks = time_blocks.get(day, {})
-            if not day_blocks:
-                ttk.Label(self.schedule_summary_frame, text="  No blocks configured").pack(anchor="w", padx=10, pady=1)
-            else:
-                # Iterate through the blocks and display each one
                 for block_name, details in day_blocks.items():
                     # Ensure 'details' is a dictionary
                     if not isinstance(details, dict):
@@ -1246,10 +2018,29 @@ class DynamiXGUI(tk.Tk):
                     start_time = details.get("start_time", "N/A")
                     end_time = details.get("end_time", "N/A")
                     limit = details.get("limit", "N/A")
-
-                    # Display block details
                     summary = f"  {block_name}: {start_time} - {end_time} (Limit: {limit})"
-                    ttk.Label(self.schedule_summary_frame, text=summary).pack(anchor="w", padx=20, pady=1)
+                    rows.append(((day, block_name), summary, {}, {"anchor": "w", "padx": 20, "pady": 1}))
+
+        # Reuse pooled labels, creating them on first use and updating only changed text
+        entries = []
+        for key, text, label_options, pack_options in rows:
+            entry = self._summary_widgets.get(key)
+            if entry is None:
+                label = ttk.Label(self.schedule_summary_frame, text=text, **label_options)
+                self._add_mousewheel_tag(label, self._settings_wheel_tag)
+                entry = self._summary_widgets[key] = [label, text, pack_options]
+            elif entry[1] != text:
+                entry[0].configure(text=text)
+                entry[1] = text
+            entries.append(entry)
+
+        labels = [entry[0] for entry in entries]
+        if labels != self._summary_packed:
+            for label in self._summary_packed:
+                label.pack_forget()
+            for label, _, pack_options in entries:
+                label.pack(**pack_options)
+            self._summary_packed = labels
 
     def _create_logs_tab(self):
         """
@@ -1292,25 +2083,79 @@ class DynamiXGUI(tk.Tk):
         self.restart_button = ttk.Button(button_frame, text="Restart Program", bootstyle="warning", command=self.restart_program)
         self.restart_button.pack(side="left", padx=10)
 
-        # Add the custom log handler with queue
-        gui_handler = GuiHandler(self.log_queue)
-        gui_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
-        logging.getLogger().addHandler(gui_handler)
+        # Add the custom log handler with queue; it schedules a drain whenever a record arrives
+        self.gui_handler = GuiHandler(self.log_queue, self)
+        self.gui_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+        logging.getLogger().addHandler(self.gui_handler)
 
-        # Schedule a periodic check of the log queue
-        self.after(100, self.process_log_queue)
+        # Pick up anything logged before the handler was attached to the window
+        self.after(0, self.process_log_queue_once)
 
-    def process_log_queue(self):
+    def process_log_queue_once(self):
         """
-        Process all messages in the log queue and display them in the logs_text widget.
+        Process pending messages in the log queue and display them in the logs_text widget.
+        Runs on demand when GuiHandler receives a record instead of on a timer.
         """
-        while not self.log_queue.empty():
-            msg = self.log_queue.get()
+        lines = self.gui_handler.drain()
+        if lines:
             self.logs_text.config(state="normal")
-            self.logs_text.insert(tk.END, msg + "\n")
+            self.logs_text.insert(tk.END, "\n".join(lines) + "\n")
+            # Keep the widget's buffer bounded so scrolling stays cheap
+            line_count = int(self.logs_text.index("end-1c").split(".")[0])
+            if line_count > LOG_VIEW_MAX_LINES:
+                self.logs_text.delete("1.0", f"{LOG_VIEW_TRIM_LINES + 1}.0")
             self.logs_text.config(state="disabled")
             self.logs_text.see(tk.END)
-        self.after(100, self.process_log_queue)
+
+        # A full batch means more may be pending; continue on the next loop turn. This avoids
+        # a separate Queue.empty() check, which takes the queue lock again and can be stale
+        if len(lines) == LOG_DRAIN_BATCH:
+            self.after(0, self.process_log_queue_once)
+
+    def _post_ui(self, kind, value):
+        """
+        Queue a background worker result and schedule process_ui_queue to apply it.
+        Safe to call from any thread.
+
+        Args:
+            kind (str): Type of result, which selects the handler in process_ui_queue.
+            value: Payload passed to that handler.
+        """
+        self.ui_queue.put((kind, value))
+
+        # Only one pending drain per burst; process_ui_queue clears the flag
+        if self._ui_drain_scheduled:
+            return
+        self._ui_drain_scheduled = True
+        try:
+            self.after(0, self.process_ui_queue)
+        except (RuntimeError, tk.TclError):
+            # Main loop not running (yet) or window already destroyed; the drain
+            # scheduled in __init__ picks the result up once the loop starts
+            self._ui_drain_scheduled = False
+
+    def process_ui_queue(self):
+        """
+        Apply results posted by background workers to the widgets they belong to.
+        Runs on demand when _post_ui queues a result instead of on a timer.
+        """
+        self._ui_drain_scheduled = False
+        while True:
+            try:
+                kind, value = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "server_name":
+                self._show_server_name(value)
+            elif kind == "user_exemptions":
+                self._render_exemption_widgets(*value)
+            elif kind == "library_collections":
+                self._render_library_collections(*value)
+            elif kind == "used_collections":
+                if self._tab_built["exclusion"]:
+                    self.refresh_exclusion_list(value)
+                else:
+                    self._pending_used_collections = value
 
     def _create_exclusion_tab(self):
         """
@@ -1342,8 +2187,9 @@ class DynamiXGUI(tk.Tk):
         ttk.Button(button_frame, text="Remove Selected", bootstyle="warning", command=self.remove_exclusion_list_item).pack(fill="x", pady=5)
         ttk.Button(button_frame, text="Reset List", bootstyle="warning", command=self.reset_exclusion_list).pack(fill="x", pady=5)
 
-        # Load exclusions immediately at startup
-        self.refresh_exclusion_list()
+        # Fill the list with the exclusions loaded at startup, reading the file if they are not in yet
+        used_collections, self._pending_used_collections = self._pending_used_collections, None
+        self.refresh_exclusion_list(used_collections)
 
     def remove_exclusion_list_item(self):
         """
@@ -1354,12 +2200,13 @@ class DynamiXGUI(tk.Tk):
             messagebox.showwarning("Warning", "No collection selected.")
             return
 
-        used_collections = load_used_collections()
-        for index in selected_items:
-            item_text = self.exclusion_listbox.get(index)
-            collection_name = item_text.split(" (")[0]
-            if collection_name in used_collections:
-                del used_collections[collection_name]
+        # Fetch every row in one Tcl call, then drop all selected names in a single rebuild
+        all_items = self.exclusion_listbox.get(0, tk.END)
+        to_remove = {all_items[index].rsplit(" (Expires: ", 1)[0] for index in selected_items}
+        used_collections = {
+            name: expiration for name, expiration in load_used_collections().items()
+            if name not in to_remove
+        }
 
         save_used_collections(used_collections)
         self.refresh_exclusion_list()
@@ -1371,26 +2218,42 @@ class DynamiXGUI(tk.Tk):
         """
         try:
             reset_exclusion_list_file()
-            # Refresh the Exclusion List tab
-            self.refresh_exclusion_list()
+            # Refresh the Exclusion List tab; if it is not built yet it reads the file when opened
+            if self._tab_built["exclusion"]:
+                self.refresh_exclusion_list()
+            else:
+                self._pending_used_collections = None
         except Exception as e:
             logging.error(f"Error resetting exclusion list: {e}")
             messagebox.showerror("Error", "Failed to reset the exclusion list.")
 
-    def refresh_exclusion_list(self):
+    def refresh_exclusion_list(self, used_collections=None):
         """
         Refresh and populate the exclusion list from the saved exclusions file.
+
+        Args:
+            used_collections (dict, optional): Already loaded exclusions; read from disk if omitted.
         """
+        if not self._tab_built["exclusion"]:
+            # Drop exclusions loaded earlier so building the tab reads the current file
+            self._pending_used_collections = None
+            return
+
         logging.info("Refreshing Exclusion List tab.")
         # Clear the listbox
         self.exclusion_listbox.delete(0, tk.END)
 
         # Load used collections
-        used_collections = load_used_collections()
+        if used_collections is None:
+            used_collections = load_used_collections()
 
-        # Populate the listbox with exclusions
-        for collection_name, expiration_date in used_collections.items():
-            self.exclusion_listbox.insert(tk.END, f"{collection_name} (Expires: {expiration_date})")
+        # Populate the listbox with exclusions, inserting many rows per Tcl call
+        items = [
+            f"{collection_name} (Expires: {date.fromordinal(expiration)})"
+            for collection_name, expiration in used_collections.items()
+        ]
+        for start in range(0, len(items), LISTBOX_INSERT_CHUNK):
+            self.exclusion_listbox.insert(tk.END, *items[start:start + LISTBOX_INSERT_CHUNK])
 
     def _create_user_exemptions_tab(self):
         """
@@ -1399,9 +2262,13 @@ class DynamiXGUI(tk.Tk):
         frame = ttk.Frame(self.user_exemptions_tab, padding="10")
         frame.pack(fill="both", expand=True)
 
-        # Top Save Button
-        save_button = ttk.Button(frame, text="Save Exemptions", bootstyle="warning", command=self.save_user_exemptions_gui)
-        save_button.pack(anchor="center", pady=(0, 10))
+        # Top Save and Force Refresh Buttons
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(anchor="center", pady=(0, 10))
+        save_button = ttk.Button(button_frame, text="Save Exemptions", bootstyle="warning", command=self.save_user_exemptions_gui)
+        save_button.pack(side="left", padx=5)
+        force_refresh_button = ttk.Button(button_frame, text="Force Refresh", command=self._force_refresh_user_exemptions)
+        force_refresh_button.pack(side="left", padx=5)
 
         # Explanation label
         explanation_label = ttk.Label(
@@ -1427,41 +2294,81 @@ class DynamiXGUI(tk.Tk):
         scrollbar.pack(side="right", fill="y")
 
         # Frame for library sections inside the canvas
-        self.libraries_frame = ttk.Frame(self.exemptions_canvas)
-        self.canvas_window = self.exemptions_canvas.create_window((0, 0), window=self.libraries_frame, anchor="n")
+        self._exemptions_scroll_pending = False
+        self.libraries_frame = None
+        self.canvas_window = None
+        self._replace_libraries_frame()
 
-        # Adjust scroll region dynamically
-        def on_frame_configure(event):
-            self.exemptions_canvas.configure(scrollregion=self.exemptions_canvas.bbox("all"))
+        # Bind mousewheel scrolling; refresh_user_exemptions tags the library widgets it creates
+        self._exemptions_wheel_tag = self._bind_mousewheel(self.exemptions_canvas)
 
-        self.libraries_frame.bind("<Configure>", on_frame_configure)
+        # Load libraries and populate
+        self.refresh_user_exemptions()
 
-        # Bind mousewheel scrolling
-        def _on_mousewheel(event):
-            self.exemptions_canvas.yview_scroll(-1 * (event.delta // 120), "units")
+    def _replace_libraries_frame(self):
+        """
+        Swap in an empty frame for the library sections inside the exemptions canvas.
 
-        self.exemptions_canvas.bind("<Enter>",
-                                    lambda e: self.exemptions_canvas.bind_all("<MouseWheel>", _on_mousewheel))
-        self.exemptions_canvas.bind("<Leave>", lambda e: self.exemptions_canvas.unbind_all("<MouseWheel>"))
+        Destroying the old frame tears down all of its widgets in a single Tk call instead of
+        one destroy() per child.
+        """
+        if self.libraries_frame is not None:
+            self.libraries_frame.destroy()
+        self.libraries_frame = ttk.Frame(self.exemptions_canvas)
+        if self.canvas_window is None:
+            self.canvas_window = self.exemptions_canvas.create_window((0, 0), window=self.libraries_frame, anchor="n")
+        else:
+            self.exemptions_canvas.itemconfig(self.canvas_window, window=self.libraries_frame)
 
-        # Load libraries and populate
-        self.refresh_user_exemptions()
+        # Adjust scroll region dynamically, once per burst of layout changes
+        self.libraries_frame.bind("<Configure>", lambda e: self._schedule_exemptions_scrollregion())
+
+    def _schedule_exemptions_scrollregion(self):
+        """
+        Schedule a scroll region update of the exemptions canvas for when the event loop is idle.
+
+        Every child layout change fires <Configure> on libraries_frame; a burst of them results
+        in a single bbox("all") scan.
+        """
+        if not self._exemptions_scroll_pending:
+            self._exemptions_scroll_pending = True
+            self.exemptions_canvas.after_idle(self._update_exemptions_scrollregion)
+
+    def _update_exemptions_scrollregion(self):
+        """
+        Update the exemptions canvas scroll region to its current content.
+        """
+        self._exemptions_scroll_pending = False
+        self.exemptions_canvas.configure(scrollregion=self.exemptions_canvas.bbox("all"))
 
     def save_user_exemptions_gui(self):
         """
         Save the user exemptions from the GUI to the file.
         """
         try:
-            # Collect all selected exemptions across all libraries
-            exemptions = []
+            # Only libraries with checkbox changes need their variables read; every other library,
+            # loaded or not, still matches the saved exemptions
+            dirty_titles = set()
+            clean_titles = set()
             for library_name, checkboxes in self.user_exemption_checkboxes.items():
-                for collection_name, var in checkboxes.items():
-                    if var.get() == 1:  # If the checkbox is selected
-                        exemptions.append(collection_name)
+                (dirty_titles if library_name in self._dirty_libraries else clean_titles).update(checkboxes)
+
+            exemptions = [
+                title for title in self.user_exemptions
+                if title not in dirty_titles or title in clean_titles
+            ]
+            exemptions.extend(
+                title
+                for library_name in self._dirty_libraries
+                for title, var in self.user_exemption_checkboxes.get(library_name, {}).items()
+                if var.get() == 1  # If the checkbox is selected
+            )
+            exemptions = list(dict.fromkeys(exemptions))  # Drop duplicates, keep order
 
             # Save exemptions to file
             self.user_exemptions = exemptions
             save_user_exemptions(exemptions)
+            self._dirty_libraries.clear()
             messagebox.showinfo("Success", "User exemptions saved successfully.")
             logging.info("User exemptions saved successfully.")
         except Exception as e:
@@ -1471,67 +2378,301 @@ class DynamiXGUI(tk.Tk):
     def refresh_user_exemptions(self):
         """
         Refresh the list of collections for user exemptions.
+
+        The Plex requests run on the network pool; _render_exemption_widgets builds the widgets
+        on the Tk thread once process_ui_queue receives the result.
         """
-        # Clear existing widgets and reset the dictionary
-        for widget in self.libraries_frame.winfo_children():
-            widget.destroy()
+        # Clear existing widgets and reset the dictionaries
+        self._replace_libraries_frame()
         self.user_exemption_checkboxes = {}
+        self._exemption_frames = {}
+        self._dirty_libraries.clear()  # Unsaved checkbox changes are discarded by a refresh
+
+        # Placeholder until the worker reports back
+        ttk.Label(self.libraries_frame, text="Loading...", font=("Segoe UI", 12, "italic")).grid(row=0, column=0, pady=20)
+
+        # Results from an older refresh are dropped when they arrive
+        self._refresh_token += 1
+        self._net_pool.submit(
+            self._fetch_exemption_data, self._refresh_token, list(self.config.get("libraries", []))
+        )
+
+    def _fetch_exemption_data(self, token, library_names):
+        """
+        Look up the library sections on a worker thread and post them to the UI queue.
+
+        Collections are loaded per library when the user expands it (see _expand_library).
+
+        Must not touch Tk widgets; _render_exemption_widgets applies the result on the Tk thread.
+
+        Args:
+            token (int): Refresh token the result belongs to.
+            library_names (list): Names of the libraries to load.
+        """
+        # Titles cached by an earlier run are reused while the library is unchanged
+        if self._collections_cache is None:
+            self._collections_cache = load_collection_cache()
 
         # Connect to Plex server if not already connected
         if not self.plex:
             try:
-                self.plex = connect_to_plex(self.config)
+                self.plex = connect_to_plex(
+                    self.config, timeout=GUI_PLEX_TIMEOUT, connect_retries=GUI_PLEX_CONNECT_RETRIES
+                )
             except Exception as e:
                 logging.error("Error connecting to Plex server.")
+                self._post_ui("user_exemptions", (token, None))
                 return
 
+        # Re-read the section list once so updatedAt reflects the server's current state
+        try:
+            sections = {section.title: section for section in self.plex.library.sections()}
+        except Exception as e:
+            logging.error(f"Error loading Plex libraries: {e}")
+            self._post_ui("user_exemptions", (token, None))
+            return
+
+        # (library name, library section, error message) per library
+        data = []
+        for library_name in library_names:
+            try:
+                library = sections.get(library_name) or self.plex.library.section(library_name)
+                data.append((library_name, library, None))
+            except Exception as e:
+                data.append((library_name, None, str(e)))
+
+        # Warm the collection cache for every library on the prefetch pool, so expanding one is
+        # instant; the futures are published before the Load buttons exist so _expand_library sees them
+        futures = {
+            library.title: self._prefetch_pool.submit(self._prefetch_collection_titles, library)
+            for _, library, error in data if error is None
+        }
+        self._prefetch_futures = futures
+        if futures:
+            self._prefetch_pool.submit(self._save_after_prefetch, list(futures.values()))
+
+        self._post_ui("user_exemptions", (token, data))
+
+    def _save_after_prefetch(self, futures):
+        """
+        Write the collection cache once every prefetch of a refresh has finished.
+
+        Submitted after the prefetches, so it only takes a pool worker once they have all started.
+
+        Args:
+            futures (list): Futures of the prefetches to wait for.
+        """
+        wait(futures)
+        self._save_collection_cache()
+
+    def _prefetch_collection_titles(self, library):
+        """
+        Load a library's collection titles into the cache, ignoring errors.
+
+        Errors are reported when the library is expanded and the fetch is retried.
+
+        Args:
+            library (plexapi.library.LibrarySection): Library section to read.
+        """
+        try:
+            self._get_collection_titles(library)
+        except Exception as e:
+            logging.debug(f"Prefetching collections of '{library.title}' failed: {e}")
+
+    def _render_exemption_widgets(self, token, data):
+        """
+        Build a collapsed frame per library from the data loaded by _fetch_exemption_data.
+
+        Args:
+            token (int): Refresh token the data belongs to.
+            data (list): (library name, library section, error message) tuples, or None if Plex was unreachable.
+        """
+        if token != self._refresh_token:
+            return  # A newer refresh is in flight
+
+        # Remove the loading placeholder
+        self._replace_libraries_frame()
+        if data is None:
+            return
+
         # Grid positioning
         row, col = 0, 0  # Start at the first row and column
 
         # Process each library
-        for library_name in self.config.get("libraries", []):
-            try:
-                # Create a labeled frame for the library
-                library_frame = ttk.LabelFrame(self.libraries_frame, text=library_name, padding=10)
-                library_frame.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
-                self.user_exemption_checkboxes[library_name] = {}
-
-                # Add a Select All checkbox
-                select_all_var = tk.BooleanVar(value=False)  # Independent state for "Select All"
-                ttk.Checkbutton(
-                    library_frame,
-                    text="Select All",
-                    variable=select_all_var,
-                    command=lambda lib=library_name, var=select_all_var: self._toggle_select_all(lib, var)
-                ).pack(anchor="w", padx=5, pady=5)
-
-                # Load collections for the library
-                library = self.plex.library.section(library_name)
-                for idx, collection in enumerate(library.collections()):
-                    var = tk.IntVar(value=1 if collection.title in self.user_exemptions else 0)
-
-                    # Alternate background colors for better readability
-                    bg_color = "white" if idx % 2 == 0 else "lightgray"
-
-                    cb = tk.Checkbutton(
-                        library_frame,
-                        text=collection.title,
-                        variable=var,
-                        anchor="w",
-                        bg=bg_color
-                    )
-                    cb.pack(fill="x", padx=20, pady=2)
-                    self.user_exemption_checkboxes[library_name][collection.title] = var
+        for library_name, library, error in data:
+            if error is not None:
+                logging.error(f"Error loading library '{library_name}': {error}")
+                messagebox.showerror("Error", f"Error loading library '{library_name}': {error}")
+                continue
 
-                # Update grid position
-                col += 1  # Move to the next column
-                if col >= 3:  # Wrap to the next row after 3 columns
-                    col = 0
-                    row += 1
+            # Create a labeled frame for the library; its collections load when expanded
+            library_frame = ttk.LabelFrame(self.libraries_frame, text=library_name, padding=10)
+            library_frame.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+            self._exemption_frames[library_name] = library_frame
+            self._add_load_button(library_frame, library_name, library)
 
-            except Exception as e:
-                logging.error(f"Error loading library '{library_name}': {e}")
-                messagebox.showerror("Error", f"Error loading library '{library_name}': {e}")
+            # Update grid position
+            col += 1  # Move to the next column
+            if col >= 3:  # Wrap to the next row after 3 columns
+                col = 0
+                row += 1
+
+        self._add_mousewheel_tag(self.libraries_frame, self._exemptions_wheel_tag)
+
+    def _add_load_button(self, library_frame, library_name, library):
+        """
+        Add the button that loads a collapsed library's collections.
+
+        Args:
+            library_frame (ttk.LabelFrame): Frame of the library in the User Exemptions tab.
+            library_name (str): Name of the library as configured.
+            library (plexapi.library.LibrarySection): Library section to read.
+        """
+        ttk.Button(
+            library_frame,
+            text=f"Load {library_name}…",
+            command=lambda: self._expand_library(library_name, library)
+        ).pack(anchor="center", padx=5, pady=5)
+
+    def _expand_library(self, library_name, library):
+        """
+        Load the collections of one library in the background; the Load button shows progress meanwhile.
+
+        Args:
+            library_name (str): Name of the library as configured.
+            library (plexapi.library.LibrarySection): Library section to read.
+        """
+        library_frame = self._exemption_frames.get(library_name)
+        if library_frame is None:
+            return
+        for widget in library_frame.winfo_children():
+            widget.configure(text=f"Loading {library_name}…", state="disabled")
+
+        token = self._refresh_token
+        prefetch = self._prefetch_futures.pop(library.title, None)
+        if prefetch is not None and not prefetch.cancel():
+            # The prefetch is already loading this library; read its result from the cache once it is done
+            def fetch_after_prefetch(_):
+                try:
+                    self._net_pool.submit(self._fetch_library_titles, token, library_name, library)
+                except RuntimeError:
+                    pass  # The window was closed and the pool shut down meanwhile
+
+            prefetch.add_done_callback(fetch_after_prefetch)
+            return
+        # Not prefetched, or still queued behind other libraries (now cancelled): fetch it directly
+        self._net_pool.submit(self._fetch_library_titles, token, library_name, library)
+
+    def _fetch_library_titles(self, token, library_name, library):
+        """
+        Read a library's collection titles on a worker thread and post them to the UI queue.
+
+        Args:
+            token (int): Refresh token the request belongs to.
+            library_name (str): Name of the library as configured.
+            library (plexapi.library.LibrarySection): Library section to read.
+        """
+        try:
+            result = (token, library_name, library, self._get_collection_titles(library), None)
+        except Exception as e:
+            result = (token, library_name, library, None, str(e))
+        self._post_ui("library_collections", result)
+        self._save_collection_cache()
+
+    def _render_library_collections(self, token, library_name, library, titles, error):
+        """
+        Replace a library's Load button with its Select All checkbox and collection list.
+
+        Args:
+            token (int): Refresh token the data belongs to.
+            library_name (str): Name of the library as configured.
+            library (plexapi.library.LibrarySection): Library section that was read.
+            titles (list): Collection titles, or None if loading failed.
+            error (str): Error message if loading failed, otherwise None.
+        """
+        library_frame = self._exemption_frames.get(library_name)
+        if token != self._refresh_token or library_frame is None:
+            return  # The tab was refreshed since the request was made
+
+        for widget in library_frame.winfo_children():
+            widget.destroy()
+        if error is not None:
+            logging.error(f"Error loading library '{library_name}': {error}")
+            messagebox.showerror("Error", f"Error loading library '{library_name}': {error}")
+            self._add_load_button(library_frame, library_name, library)  # Allow a retry
+            return
+
+        self.user_exemption_checkboxes[library_name] = {}
+
+        # Add a Select All checkbox
+        select_all_var = tk.BooleanVar(value=False)  # Independent state for "Select All"
+        ttk.Checkbutton(
+            library_frame,
+            text="Select All",
+            variable=select_all_var,
+            command=lambda: self._toggle_select_all(library_name, select_all_var)
+        ).pack(anchor="w", padx=5, pady=5)
+
+        # Only the visible rows get widgets. Variables are reused across refreshes so repeated
+        # refreshes do not keep registering new Tcl variables; each starts from the saved state.
+        exempt_set = set(self.user_exemptions)  # Saved list keeps file order; the set is for lookups
+        items = []
+        for title in titles:
+            value = 1 if title in exempt_set else 0
+            var = self._exemption_vars.get((library_name, title))
+            if var is None:
+                var = self._exemption_vars[(library_name, title)] = tk.IntVar(value=value)
+                var.trace_add("write", lambda *args, lib=library_name: self._dirty_libraries.add(lib))
+            else:
+                var.set(value)
+            self.user_exemption_checkboxes[library_name][title] = var
+            items.append((title, var))
+        self._dirty_libraries.discard(library_name)  # Resetting reused variables is not a user change
+
+        VirtualCheckList(library_frame, items).pack(fill="both", expand=True, padx=(20, 0))
+        self._add_mousewheel_tag(library_frame, self._exemptions_wheel_tag)
+
+    def _get_collection_titles(self, library):
+        """
+        Return the collection titles of a library, reusing the cached list while the section is unchanged.
+
+        Args:
+            library (plexapi.library.LibrarySection): Library section to read.
+
+        Returns:
+            list: Collection titles in Plex order.
+        """
+        updated_at = int(library.updatedAt.timestamp()) if library.updatedAt else None
+        cached = self._collections_cache.get(library.title)
+        if cached and updated_at is not None and cached.get("updatedAt") == updated_at:
+            return cached["titles"]
+        # Same request library.collections() makes (type 18 = collection), but only the title
+        # attribute is read instead of building a full Collection object per entry
+        container = self.plex.query(f"/library/sections/{library.key}/all?type=18")
+        titles = [element.attrib["title"] for element in container if "title" in element.attrib]
+        self._collections_cache[library.title] = {"updatedAt": updated_at, "titles": titles}
+        self._collections_cache_dirty = True
+        return titles
+
+    def _save_collection_cache(self):
+        """
+        Write the collection cache to disk if it changed since the last write.
+        """
+        with self._collections_cache_lock:
+            if not self._collections_cache_dirty:
+                return
+            self._collections_cache_dirty = False
+            try:
+                save_collection_cache(dict(self._collections_cache))
+            except OSError as e:
+                logging.warning(f"Could not save collection cache: {e}")
+
+    def _force_refresh_user_exemptions(self):
+        """
+        Drop the cached collection lists and reload the User Exemptions tab from Plex.
+        """
+        self._collections_cache = {}
+        self.refresh_user_exemptions()
 
     def _toggle_select_all(self, library_name, select_all_var):
         """
@@ -1549,11 +2690,38 @@ class DynamiXGUI(tk.Tk):
         """
         Handler when a library is selected from the dropdown.
 
+        Debounced: a burst of selections (e.g. arrowing through the dropdown) results in a
+        single refresh 150 ms after the last one.
+
         Args:
             event (tk.Event, optional): Event object.
         """
+        if self._summary_after_id:
+            self.after_cancel(self._summary_after_id)
+        self._summary_after_id = self.after(150, self._on_library_selected_now)
+
+    def _on_library_selected_now(self):
+        """
+        Populate the time block inputs and summary for the currently selected library.
+        """
+        self._summary_after_id = None
         self._populate_library_time_blocks()
-        self._refresh_schedule_summary()
+        self._refresh_schedule_summary_now()
+
+    def _library_time_blocks(self, library_name):
+        """
+        Look up the configured time blocks of a library with a single walk through the config.
+
+        Args:
+            library_name (str): Name of the library.
+
+        Returns:
+            The library's "time_blocks" value, or an empty dict if none is configured.
+        """
+        library_settings = self.config.get("libraries_settings", {}).get(library_name, {})
+        if not isinstance(library_settings, dict):
+            return {}
+        return library_settings.get("time_blocks", {})
 
     def _populate_library_time_blocks(self):
         """
@@ -1563,24 +2731,26 @@ class DynamiXGUI(tk.Tk):
         if not library_name:
             return
 
-        # Reset inputs
-        for block in self.time_block_entries.values():
-            for field in block.values():
-                field.delete(0, "end")
-
         # Fetch library time block data
-        library_settings = self.config.get("libraries_settings", {}).get(library_name, {})
-        time_blocks = library_settings.get("time_blocks", {})
+        time_blocks = self._library_time_blocks(library_name)
 
         if not isinstance(time_blocks, dict):
             logging.error(f"Invalid time_blocks for library '{library_name}': {time_blocks}")
-            return
+            time_blocks = {}  # Leave the inputs empty
 
+        # Only rewrite entries whose text actually changes
         for block_name, entries in self.time_block_entries.items():
             block_data = time_blocks.get(block_name, {})
-            entries["start_time"].insert(0, block_data.get("start_time", ""))
-            entries["end_time"].insert(0, block_data.get("end_time", ""))
-            entries["limit"].insert(0, str(block_data.get("limit", "")))
+            values = {
+                "start_time": block_data.get("start_time", ""),
+                "end_time": block_data.get("end_time", ""),
+                "limit": str(block_data.get("limit", "")),
+            }
+            for field_name, value in values.items():
+                field = entries[field_name]
+                if field.get() != value:
+                    field.delete(0, "end")
+                    field.insert(0, value)
 
     def _validate_time_format(self, time_str):
         """
@@ -1592,11 +2762,7 @@ class DynamiXGUI(tk.Tk):
         Returns:
             bool: True if valid, False otherwise.
         """
-        try:
-            datetime.strptime(time_str, "%H:%M")
-            return True
-        except ValueError:
-            return False
+        return _HHMM_RE.fullmatch(time_str) is not None
 
     def start_script(self, show_message=True):
         """
@@ -1606,6 +2772,9 @@ class DynamiXGUI(tk.Tk):
             show_message (bool, optional): Whether to show a message upon starting.
         """
         if not self.script_thread or not self.script_thread.is_alive():
+            # main() reads the config from disk, so write any pending changes first
+            self._flush_config()
+
             # Clear the stop event before starting
             self.stop_event.clear()
 
@@ -1649,20 +2818,24 @@ class DynamiXGUI(tk.Tk):
         logging.info("Restarting the program...")
         print("Restarting the program...")
 
-        # Stop the automation script if it's running
+        # Stop the automation script if it's running. stop_script() already joins the thread
+        # (with a timeout) and clears self.script_thread; the thread is a daemon, so the restart
+        # proceeds even if it has not finished yet.
         if self.script_thread and self.script_thread.is_alive():
             logging.info("Stopping the automation script before restarting...")
             print("Stopping the automation script before restarting...")
             self.stop_script()
-            self.script_thread.join()
             logging.info("Automation script stopped.")
             print("Automation script stopped.")
 
         # Restart the program
         try:
+            self._flush_config()
             python = sys.executable
+            _log_listener.stop()  # Flush queued log records; execl skips atexit handlers
             os.execl(python, python, *sys.argv)
         except Exception as e:
+            _log_listener.start()
             logging.error(f"Failed to restart the program: {e}")
             print(f"Failed to restart the program: {e}")
             messagebox.showerror("Error", f"Failed to restart the program: {e}")